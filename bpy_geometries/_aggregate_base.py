@@ -0,0 +1,282 @@
+"""
+Shared machinery for the aggregate geometries.
+
+Aggregate, AggregateTouching and AggregateIntersecting all build a cluster
+by dropping randomly oriented monomers onto it. This base class holds what
+they have in common: argument validation, the seeded rotation pool, cached
+bounding boxes, mesh arrays and BVH trees for intersection tests, monomer
+creation and transform baking.
+"""
+
+import bpy
+import numpy as np
+from mathutils import Matrix, Quaternion, Vector
+from mathutils.bvhtree import BVHTree
+from .geometry import Geometry
+
+# Selects min (False) or max (True) per axis for each of the 8 bbox corners
+_BBOX_CORNER_MASK = np.array(
+    [[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)], dtype=bool
+)
+
+# Number of random rotations sampled per batch
+_QUAT_POOL_SIZE = 1024
+
+
+class AggregateBase(Geometry):
+    """Common state and helpers for geometries built from dropped monomers."""
+
+    def __init__(
+        self,
+        geometry: Geometry,
+        output_dir: str,
+        num_monomers: int = None,
+        target_diameter: float = None,
+        seed: int = None,
+    ):
+        super().__init__(output_dir)
+        self.geometry: Geometry = geometry
+
+        if num_monomers is None and target_diameter is None:
+            raise ValueError("Either num_monomers or target_diameter must be specified")
+        if num_monomers is not None and target_diameter is not None:
+            raise ValueError("Cannot specify both num_monomers and target_diameter")
+
+        self.num_monomers: int = num_monomers
+        self.target_diameter: float = target_diameter
+        self.seed: int = seed
+
+        self._rng = np.random.default_rng(seed)
+
+        # Pre-sampled (w, x, y, z) rotations, refilled in batches on demand
+        self._quat_pool = np.empty((0, 4))
+        self._quat_index = 0
+
+        # Local-space bbox (min, max) per object name, valid until the mesh changes
+        self._bbox_cache: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+        # Local vertices and polygons per object name, valid until the mesh changes
+        self._mesh_cache: dict[str, tuple[np.ndarray, list[list[int]]]] = {}
+
+        # World-space BVH per object name with the matrix it was built for
+        self._bvh_cache: dict[str, tuple[Matrix, BVHTree, np.ndarray]] = {}
+
+        # Monomer mesh and transform built once per aggregate, shared copy-on-write
+        self._template_mesh: bpy.types.Mesh | None = None
+        self._template_matrix: Matrix | None = None
+
+    def _random_quaternion(self) -> Quaternion:
+        """
+        Generate a uniformly distributed random quaternion on SO(3).
+
+        Uses the subgroup algorithm (Shoemake, 1992).
+        """
+        if self._quat_index >= len(self._quat_pool):
+            self._refill_quat_pool()
+
+        quat = self._quat_pool[self._quat_index]
+        self._quat_index += 1
+
+        return Quaternion(quat)
+
+    def _refill_quat_pool(self):
+        """Sample a batch of rotations at once to amortize RNG and trig costs."""
+        u1, u2, u3 = self._rng.random((3, _QUAT_POOL_SIZE))
+
+        r1 = np.sqrt(1 - u1)
+        r2 = np.sqrt(u1)
+        theta1 = 2 * np.pi * u2
+        theta2 = 2 * np.pi * u3
+
+        self._quat_pool = np.column_stack(
+            (
+                r1 * np.sin(theta1),
+                r1 * np.cos(theta1),
+                r2 * np.sin(theta2),
+                r2 * np.cos(theta2),
+            )
+        )
+        self._quat_index = 0
+
+    def _local_bbox(self, obj: bpy.types.Object) -> tuple[np.ndarray, np.ndarray]:
+        """Get cached local-space bounding box (min, max) of object."""
+        cached = self._bbox_cache.get(obj.name)
+        if cached is None:
+            # bound_box is only refreshed by depsgraph evaluation, which
+            # in-place mesh transforms skip, so bound the vertices directly
+            verts, _ = self._local_mesh(obj)
+            cached = (verts.min(axis=0), verts.max(axis=0))
+            self._bbox_cache[obj.name] = cached
+        return cached
+
+    def _invalidate_caches(self, obj: bpy.types.Object):
+        """Drop cached bbox, mesh arrays and BVH after the object's mesh has changed."""
+        self._bbox_cache.pop(obj.name, None)
+        self._mesh_cache.pop(obj.name, None)
+        self._bvh_cache.pop(obj.name, None)
+
+    def _world_bbox(self, obj: bpy.types.Object) -> tuple[np.ndarray, np.ndarray]:
+        """Get world-space bounding box (min, max) from the cached local bbox."""
+        local_min, local_max = self._local_bbox(obj)
+        corners = np.where(_BBOX_CORNER_MASK, local_max, local_min)
+        # matrix_basis needs no depsgraph update (objects are unparented)
+        matrix = np.array(obj.matrix_basis)
+        corners_world = corners @ matrix[:3, :3].T + matrix[:3, 3]
+        return corners_world.min(axis=0), corners_world.max(axis=0)
+
+    def _world_aabb(self, obj: bpy.types.Object) -> tuple[float, ...]:
+        """Get world-space AABB as (xmin, xmax, ymin, ymax, zmin, zmax)."""
+        world_min, world_max = self._world_bbox(obj)
+        return (
+            float(world_min[0]),
+            float(world_max[0]),
+            float(world_min[1]),
+            float(world_max[1]),
+            float(world_min[2]),
+            float(world_max[2]),
+        )
+
+    def _aabbs_overlap(self, a: tuple[float, ...], b: tuple[float, ...]) -> bool:
+        """Check if two AABBs overlap (touching counts as overlap)."""
+        return not (
+            a[1] < b[0]
+            or b[1] < a[0]
+            or a[3] < b[2]
+            or b[3] < a[2]
+            or a[5] < b[4]
+            or b[5] < a[4]
+        )
+
+    def _local_mesh(self, obj: bpy.types.Object) -> tuple[np.ndarray, list[list[int]]]:
+        """Get cached local vertex coordinates (V, 3) and polygon indices."""
+        cached = self._mesh_cache.get(obj.name)
+        if cached is None:
+            mesh = obj.data
+            verts = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+            mesh.vertices.foreach_get("co", verts)
+            loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+            mesh.loops.foreach_get("vertex_index", loop_verts)
+            loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+            mesh.polygons.foreach_get("loop_start", loop_starts)
+            polys = [p.tolist() for p in np.split(loop_verts, loop_starts[1:])]
+            cached = (verts.reshape(-1, 3), polys)
+            self._mesh_cache[obj.name] = cached
+        return cached
+
+    def _world_bvh(self, obj: bpy.types.Object) -> tuple[BVHTree, np.ndarray]:
+        """
+        Get a world-space BVH tree of the object's mesh and its world vertices.
+
+        The tree is cached per object and only rebuilt when the object has
+        moved since it was built. Uses matrix_basis, which is current as
+        soon as location/rotation change, so no depsgraph update is needed
+        (objects are unparented).
+        """
+        matrix = obj.matrix_basis.copy()
+        cached = self._bvh_cache.get(obj.name)
+        if cached is not None and cached[0] == matrix:
+            return cached[1], cached[2]
+
+        local_verts, polys = self._local_mesh(obj)
+        m = np.array(matrix)
+        world_verts = local_verts @ m[:3, :3].T + m[:3, 3]
+        tree = BVHTree.FromPolygons(world_verts.tolist(), polys)
+        self._bvh_cache[obj.name] = (matrix, tree, world_verts)
+        return tree, world_verts
+
+    def _point_inside(self, tree: BVHTree, point: Vector) -> bool:
+        """Check if point lies inside the closed mesh of tree."""
+        location, normal, _, _ = tree.find_nearest(point)
+        return location is not None and (point - location).dot(normal) < 0.0
+
+    def _check_intersection(
+        self,
+        obj1: bpy.types.Object,
+        obj2: bpy.types.Object,
+        aabb1: tuple[float, ...] = None,
+        aabb2: tuple[float, ...] = None,
+    ) -> bool:
+        """
+        Check if two objects intersect.
+
+        The world AABBs are compared first and the narrow phase is skipped
+        when they are disjoint. Precomputed AABBs can be passed in when the
+        caller tracks them itself (e.g. while translating along z). The
+        narrow phase tests BVH overlap of the two meshes, which stops at the
+        first overlapping face pair, then falls back to a containment test.
+        """
+        if aabb1 is None:
+            aabb1 = self._world_aabb(obj1)
+        if aabb2 is None:
+            aabb2 = self._world_aabb(obj2)
+        if not self._aabbs_overlap(aabb1, aabb2):
+            return False
+
+        tree1, verts1 = self._world_bvh(obj1)
+        tree2, verts2 = self._world_bvh(obj2)
+
+        # Surfaces cross if any pair of faces overlaps
+        if tree1.overlap(tree2):
+            return True
+
+        # No crossing surfaces, but one mesh may be fully inside the other
+        return self._point_inside(tree2, Vector(verts1[0])) or self._point_inside(
+            tree1, Vector(verts2[0])
+        )
+
+    def _new_monomer(self, index: int) -> bpy.types.Object:
+        """
+        Create a monomer object, building a deterministic base only once.
+
+        For deterministic bases, later monomers link the template mesh instead
+        of rebuilding it; the mesh is copied when a monomer is first modified.
+        Randomized bases are rebuilt per monomer so each is a fresh realization.
+        """
+        if not self.geometry.deterministic:
+            monomer = self.geometry._create_geometry()
+        elif self._template_mesh is None:
+            monomer = self.geometry._create_geometry()
+            self._template_mesh = monomer.data.copy()
+            # Fake user keeps users > 1 while any monomer shares the template
+            self._template_mesh.use_fake_user = True
+            self._template_matrix = monomer.matrix_basis.copy()
+        else:
+            monomer = bpy.data.objects.new("Monomer", self._template_mesh)
+            bpy.context.collection.objects.link(monomer)
+            monomer.matrix_basis = self._template_matrix
+
+        monomer.name = f"Monomer_{index}"
+        return monomer
+
+    def _release_template(self):
+        """Drop the template mesh once no monomer shares it."""
+        if self._template_mesh is not None:
+            self._template_mesh.use_fake_user = False
+            if self._template_mesh.users == 0:
+                bpy.data.meshes.remove(self._template_mesh)
+        self._template_mesh = None
+        self._template_matrix = None
+
+    def _apply_transform(
+        self, obj: bpy.types.Object, location: bool = False, rotation: bool = False
+    ):
+        """
+        Bake location and/or rotation into the mesh without bpy.ops.
+
+        The baked part is removed from the object's matrix, so the world
+        geometry is unchanged.
+        """
+        loc, rot, scale = obj.matrix_basis.decompose()
+        if location:
+            loc = Vector()
+        if rotation:
+            rot = Quaternion()
+        basis = Matrix.LocRotScale(loc, rot, scale)
+
+        # Monomers share the template mesh until they are first modified
+        if obj.data.users > 1:
+            obj.data = obj.data.copy()
+        obj.data.transform(basis.inverted() @ obj.matrix_basis)
+        obj.matrix_basis = basis
+        obj.data.update()
+        self._invalidate_caches(obj)
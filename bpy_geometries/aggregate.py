@@ -1,55 +1,37 @@
 import bpy
 import bmesh
-import random
-import math
-from mathutils import Vector, Euler
+import numpy as np
+from ._aggregate_base import AggregateBase
 from .geometry import Geometry
 
-
-class Aggregate(Geometry):
+class Aggregate(AggregateBase):
     def __init__(
         self,
         geometry: Geometry,
         output_dir: str,
         num_monomers: int = None,
         target_diameter: float = None,
+        seed: int = None,
     ):
-        super().__init__(output_dir)
-        self.geometry: Geometry = geometry
-
-        if num_monomers is None and target_diameter is None:
-            raise ValueError("Either num_monomers or target_diameter must be specified")
-        if num_monomers is not None and target_diameter is not None:
-            raise ValueError("Cannot specify both num_monomers and target_diameter")
-
-        self.num_monomers: int = num_monomers
-        self.target_diameter: float = target_diameter
+        super().__init__(geometry, output_dir, num_monomers, target_diameter, seed)
 
     def _get_bounding_box_z_height(self, obj: bpy.types.Object) -> float:
-        bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-        z_coords = [corner.z for corner in bbox_corners]
-        return max(z_coords) - min(z_coords)
+        world_min, world_max = self._world_bbox(obj)
+        return float(world_max[2] - world_min[2])
 
     def _get_planar_diameters(self, obj: bpy.types.Object) -> dict:
-        bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-        x_coords = [corner.x for corner in bbox_corners]
-        y_coords = [corner.y for corner in bbox_corners]
-        z_coords = [corner.z for corner in bbox_corners]
-
-        x_min = min(x_coords)
-        x_max = max(x_coords)
-        y_min = min(y_coords)
-        y_max = max(y_coords)
-        z_min = min(z_coords)
-        z_max = max(z_coords)
-
-        x_extent = x_max - x_min
-        y_extent = y_max - y_min
-        z_extent = z_max - z_min
-
-        xy_diameter = max(x_extent, y_extent)
-        xz_diameter = max(x_extent, z_extent)
-        yz_diameter = max(y_extent, z_extent)
+        world_min, world_max = self._world_bbox(obj)
+
+        x_min, y_min, z_min = world_min
+        x_max, y_max, z_max = world_max
+
+        extents = world_max - world_min
+        x_extent, y_extent, z_extent = extents
+
+        # Pairwise maxima of (x, y), (x, z), (y, z) extents
+        xy_diameter, xz_diameter, yz_diameter = np.maximum(
+            extents[[0, 0, 1]], extents[[1, 2, 2]]
+        )
 
         print(
             f"Bounding box: x=[{x_min:.2f}, {x_max:.2f}], y=[{y_min:.2f}, {y_max:.2f}], z=[{z_min:.2f}, {z_max:.2f}]"
@@ -65,118 +47,110 @@ class Aggregate(Geometry):
             "yz": yz_diameter,
         }
 
-    def _check_intersection(
-        self, obj1: bpy.types.Object, obj2: bpy.types.Object
-    ) -> bool:
-        bpy.ops.object.select_all(action="DESELECT")
-        obj1.select_set(True)
-        bpy.context.view_layer.objects.active = obj1
-
-        bpy.ops.object.modifier_add(type="BOOLEAN")
-        boolean_mod = obj1.modifiers[-1]
-        boolean_mod.operation = "INTERSECT"
-        boolean_mod.object = obj2
-        boolean_mod.solver = "FAST"
-
-        depsgraph = bpy.context.evaluated_depsgraph_get()
-        obj_eval = obj1.evaluated_get(depsgraph)
-
-        has_intersection = len(obj_eval.data.vertices) > 0
-
-        bpy.ops.object.modifier_remove(modifier=boolean_mod.name)
-
-        return has_intersection
-
     def _apply_random_rotation(self, obj: bpy.types.Object):
-        rotation_angles = (
-            random.uniform(0, 2 * math.pi),
-            random.uniform(0, 2 * math.pi),
-            random.uniform(0, 2 * math.pi),
-        )
-        obj.rotation_euler = rotation_angles
-        bpy.context.view_layer.update()
+        obj.rotation_mode = "QUATERNION"
+        obj.rotation_quaternion = self._random_quaternion()
 
     def _translate_until_touching(
         self, monomer: bpy.types.Object, aggregate: bpy.types.Object
     ):
-        monomer_bb = self._get_bounding_box_z_height(monomer)
-        aggregate_bb = self._get_bounding_box_z_height(aggregate)
-
-        initial_translation = (aggregate_bb + monomer_bb) / 2
-        monomer.location.z += initial_translation
-        bpy.context.view_layer.update()
+        monomer_aabb = self._world_aabb(monomer)
+        aggregate_aabb = self._world_aabb(aggregate)
+        monomer_bb = monomer_aabb[5] - monomer_aabb[4]
+
+        # Drop monomer analytically to where its AABB just clears the
+        # aggregate's AABB - the highest pose at which the meshes can touch.
+        # The monomer AABB is then tracked along z, so the depsgraph only
+        # needs updating once the search is finished
+        contact_offset = aggregate_aabb[5] - monomer_aabb[4] + 1e-6 * monomer_bb
+        monomer.location.z += contact_offset
+        monomer_aabb = (
+            *monomer_aabb[:4],
+            monomer_aabb[4] + contact_offset,
+            monomer_aabb[5] + contact_offset,
+        )
+        z_offset = 0.0
 
         num_steps = 10
 
-        for step in range(num_steps):
-            step_size = monomer_bb / (2**step)
+        step_size = monomer_bb
+
+        for _ in range(num_steps):
 
-            has_intersection = self._check_intersection(monomer, aggregate)
+            shifted_aabb = (
+                *monomer_aabb[:4],
+                monomer_aabb[4] + z_offset,
+                monomer_aabb[5] + z_offset,
+            )
+            has_intersection = self._check_intersection(
+                monomer, aggregate, shifted_aabb, aggregate_aabb
+            )
 
             if has_intersection:
                 monomer.location.z += step_size
+                z_offset += step_size
             else:
                 monomer.location.z -= step_size
+                z_offset -= step_size
 
-            bpy.context.view_layer.update()
+            step_size *= 0.5
+
+        bpy.context.view_layer.update()
 
     def _merge_objects(
         self, target: bpy.types.Object, source: bpy.types.Object
     ) -> bpy.types.Object:
-        bpy.ops.object.select_all(action="DESELECT")
-        target.select_set(True)
-        bpy.context.view_layer.objects.active = target
-
-        bpy.ops.object.modifier_add(type="BOOLEAN")
-        boolean_mod = target.modifiers[-1]
+        boolean_mod = target.modifiers.new(name="Union", type="BOOLEAN")
         boolean_mod.operation = "UNION"
         boolean_mod.object = source
         boolean_mod.solver = "EXACT"
 
-        bpy.ops.object.modifier_apply(modifier=boolean_mod.name)
+        self._bake_modifier(target, boolean_mod)
+
+        self._invalidate_caches(target)
+        self._invalidate_caches(source)
 
-        bpy.ops.object.select_all(action="DESELECT")
-        source.select_set(True)
-        bpy.ops.object.delete()
+        source_mesh = source.data
+        bpy.data.objects.remove(source, do_unlink=True)
+        if source_mesh.users == 0:
+            bpy.data.meshes.remove(source_mesh)
 
         return target
 
     def to_filename(self) -> str:
         geom_filename = self.geometry.to_filename()
+        seed_str = f"_s{self.seed}" if self.seed is not None else ""
         if self.num_monomers is not None:
-            return f"aggregate_n{self.num_monomers}_{geom_filename}"
+            return f"aggregate_n{self.num_monomers}{seed_str}_{geom_filename}"
         else:
             diameter_str = f"{self.target_diameter:.1f}".replace(".", "p")
-            return f"aggregate_d{diameter_str}_{geom_filename}"
+            return f"aggregate_d{diameter_str}{seed_str}_{geom_filename}"
 
     def _create_geometry(self) -> bpy.types.Object:
         aggregate = None
+        self._bbox_cache.clear()
+        self._mesh_cache.clear()
+        self._bvh_cache.clear()
 
         if self.num_monomers is not None:
             for i in range(self.num_monomers):
-                monomer = self.geometry._create_geometry()
-                monomer.name = f"Monomer_{i}"
+                monomer = self._new_monomer(i)
 
                 if aggregate is None:
                     aggregate = monomer
                     aggregate.name = "Aggregate"
                 else:
                     self._apply_random_rotation(aggregate)
-                    bpy.ops.object.transform_apply(
-                        location=False, rotation=True, scale=False
-                    )
+                    self._apply_transform(aggregate, rotation=True)
 
                     self._translate_until_touching(monomer, aggregate)
-                    bpy.ops.object.transform_apply(
-                        location=True, rotation=False, scale=False
-                    )
+                    self._apply_transform(monomer, location=True)
 
                     aggregate = self._merge_objects(aggregate, monomer)
         else:
             i = 0
             while True:
-                monomer = self.geometry._create_geometry()
-                monomer.name = f"Monomer_{i}"
+                monomer = self._new_monomer(i)
 
                 if aggregate is None:
                     aggregate = monomer
@@ -188,14 +162,10 @@ class Aggregate(Geometry):
                 print(f"\nMonomer {i}: Adding monomer...")
 
                 self._apply_random_rotation(aggregate)
-                bpy.ops.object.transform_apply(
-                    location=False, rotation=True, scale=False
-                )
+                self._apply_transform(aggregate, rotation=True)
 
                 self._translate_until_touching(monomer, aggregate)
-                bpy.ops.object.transform_apply(
-                    location=True, rotation=False, scale=False
-                )
+                self._apply_transform(monomer, location=True)
 
                 aggregate = self._merge_objects(aggregate, monomer)
                 i += 1
@@ -215,6 +185,8 @@ class Aggregate(Geometry):
 
                 print(f"Target: {self.target_diameter:.2f}, continuing...")
 
+        self._release_template()
+
         return aggregate
 
     def generate(self) -> str:
@@ -8,17 +8,20 @@ Algorithm:
    b. Rotate existing aggregate randomly
    c. Position monomer above aggregate, move down until intersection detected
    d. If no intersection found, re-rotate aggregate and retry
-   e. Merge monomer into aggregate (boolean union)
+3. Merge all monomers into the aggregate with one boolean union
+
+Placed monomers are kept as separate objects until the final merge. Each
+intersection probe only tests monomers whose AABBs overlap the dropped
+monomer's AABB, rather than the whole accumulated aggregate mesh.
 """
 
 import bpy
-import math
 import numpy as np
-from mathutils import Quaternion, Vector
+from mathutils import Quaternion
+from ._aggregate_base import AggregateBase
 from .geometry import Geometry
 
-
-class AggregateIntersecting(Geometry):
+class AggregateIntersecting(AggregateBase):
     """
     Create an aggregate of intersecting (overlapping) monomers.
 
@@ -47,118 +50,92 @@ class AggregateIntersecting(Geometry):
             binary_search_steps: Number of steps when searching for intersection
             max_retries: Maximum retries if no intersection found (re-rotates aggregate)
         """
-        super().__init__(output_dir)
-        self.geometry = geometry
-
-        if num_monomers is None and target_diameter is None:
-            raise ValueError("Either num_monomers or target_diameter must be specified")
-        if num_monomers is not None and target_diameter is not None:
-            raise ValueError("Cannot specify both num_monomers and target_diameter")
-
-        self.num_monomers = num_monomers
-        self.target_diameter = target_diameter
-        self.seed = seed
+        super().__init__(geometry, output_dir, num_monomers, target_diameter, seed)
         self.binary_search_steps = binary_search_steps
         self.max_retries = max_retries
 
-        self._rng = np.random.default_rng(seed)
+        # Monomers placed so far, kept unmerged until _create_geometry finishes
+        self._placed: list[bpy.types.Object] = []
 
-    def _random_quaternion(self) -> Quaternion:
-        """
-        Generate a uniformly distributed random quaternion on SO(3).
-
-        Uses the subgroup algorithm (Shoemake, 1992).
-        """
-        u1, u2, u3 = self._rng.random(3)
-
-        w = math.sqrt(1 - u1) * math.sin(2 * math.pi * u2)
-        x = math.sqrt(1 - u1) * math.cos(2 * math.pi * u2)
-        y = math.sqrt(u1) * math.sin(2 * math.pi * u3)
-        z = math.sqrt(u1) * math.cos(2 * math.pi * u3)
-
-        return Quaternion((w, x, y, z))
-
-    def _get_bounding_box_z_extent(
-        self, obj: bpy.types.Object
-    ) -> tuple[float, float, float]:
-        """Get Z extent of object's bounding box in world coordinates."""
-        bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-        z_coords = [corner.z for corner in bbox_corners]
-        return min(z_coords), max(z_coords), max(z_coords) - min(z_coords)
-
-    def _get_max_planar_diameter(self, obj: bpy.types.Object) -> float:
-        """Get the maximum planar diameter (XY, XZ, or YZ) of the object."""
-        bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-        x_coords = [corner.x for corner in bbox_corners]
-        y_coords = [corner.y for corner in bbox_corners]
-        z_coords = [corner.z for corner in bbox_corners]
-
-        x_extent = max(x_coords) - min(x_coords)
-        y_extent = max(y_coords) - min(y_coords)
-        z_extent = max(z_coords) - min(z_coords)
-
-        xy_diameter = max(x_extent, y_extent)
-        xz_diameter = max(x_extent, z_extent)
-        yz_diameter = max(y_extent, z_extent)
-
-        return max(xy_diameter, xz_diameter, yz_diameter)
-
-    def _check_intersection(
-        self, obj1: bpy.types.Object, obj2: bpy.types.Object
-    ) -> bool:
-        """Check if two objects intersect using boolean modifier."""
-        bpy.ops.object.select_all(action="DESELECT")
-        obj1.select_set(True)
-        bpy.context.view_layer.objects.active = obj1
-
-        bpy.ops.object.modifier_add(type="BOOLEAN")
-        boolean_mod = obj1.modifiers[-1]
-        boolean_mod.operation = "INTERSECT"
-        boolean_mod.object = obj2
-        boolean_mod.solver = "EXACT"
-
-        depsgraph = bpy.context.evaluated_depsgraph_get()
-        obj_eval = obj1.evaluated_get(depsgraph)
-
-        has_intersection = len(obj_eval.data.vertices) > 0
-
-        bpy.ops.object.modifier_remove(modifier=boolean_mod.name)
-
-        return has_intersection
+        # Running world bbox (min, max) of the placed monomers, None after rotation
+        self._agg_bounds: tuple[np.ndarray, np.ndarray] | None = None
 
     def _apply_rotation(self, obj: bpy.types.Object):
         """Apply rotation transform to object."""
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-        bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
-        obj.select_set(False)
+        self._apply_transform(obj, rotation=True)
 
     def _apply_location(self, obj: bpy.types.Object):
         """Apply location transform to object."""
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-        bpy.ops.object.transform_apply(location=True, rotation=False, scale=False)
-        obj.select_set(False)
-
-    def _translate_until_intersecting(
-        self, monomer: bpy.types.Object, aggregate: bpy.types.Object
-    ) -> bool:
+        self._apply_transform(obj, location=True)
+
+    def _world_vertex_bbox(
+        self, obj: bpy.types.Object
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the tight world-space bounding box (min, max) from the vertices.
+
+        Placed monomers are rotated through their matrix rather than baked,
+        so the rotated local bbox overestimates their extent.
+        """
+        local_verts, _ = self._local_mesh(obj)
+        matrix = np.array(obj.matrix_basis)
+        world_verts = local_verts @ matrix[:3, :3].T + matrix[:3, 3]
+        return world_verts.min(axis=0), world_verts.max(axis=0)
+
+    def _placed_bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        """Get world-space bbox mins and maxs of placed monomers, shape (N, 3)."""
+        bounds = [self._world_vertex_bbox(obj) for obj in self._placed]
+        mins = np.array([b[0] for b in bounds])
+        maxs = np.array([b[1] for b in bounds])
+        return mins, maxs
+
+    def _rotate_placed(self, quat: Quaternion):
+        """Rotate all placed monomers about the world origin."""
+        rotation = quat.to_matrix().to_4x4()
+        for obj in self._placed:
+            obj.matrix_basis = rotation @ obj.matrix_basis
+        self._agg_bounds = None
+
+    def _add_placed(self, monomer: bpy.types.Object):
+        """Place a monomer and grow the running aggregate bounds by its bbox."""
+        self._placed.append(monomer)
+        if self._agg_bounds is None:
+            placed_mins, placed_maxs = self._placed_bounds()
+            self._agg_bounds = (placed_mins.min(axis=0), placed_maxs.max(axis=0))
+        else:
+            monomer_min, monomer_max = self._world_vertex_bbox(monomer)
+            self._agg_bounds = (
+                np.minimum(self._agg_bounds[0], monomer_min),
+                np.maximum(self._agg_bounds[1], monomer_max),
+            )
+
+    def _translate_until_intersecting(self, monomer: bpy.types.Object) -> bool:
         """
-        Move monomer down until intersection is detected.
+        Move monomer down until it intersects one of the placed monomers.
+
+        Each probe only runs the boolean against placed monomers whose
+        AABBs overlap the monomer's AABB (broad phase).
 
         If no intersection is found after binary_search_steps, re-rotates
         aggregate and tries again up to max_retries times.
 
         Returns True if intersection found, False if all retries exhausted.
         """
+        # The monomer only moves along z, so its AABB is read once and shifted
+        monomer_aabb = self._world_aabb(monomer)
+        monomer_height = monomer_aabb[5] - monomer_aabb[4]
+        base_z = monomer.location.z
+
         for retry in range(self.max_retries):
-            _, _, monomer_height = self._get_bounding_box_z_extent(monomer)
-            _, agg_z_max, agg_height = self._get_bounding_box_z_extent(aggregate)
+            placed_mins, placed_maxs = self._placed_bounds()
+            self._agg_bounds = (placed_mins.min(axis=0), placed_maxs.max(axis=0))
+            agg_z_max = float(self._agg_bounds[1][2])
+            agg_height = agg_z_max - float(self._agg_bounds[0][2])
 
             # Start with monomer well above aggregate
             initial_z = agg_z_max + monomer_height
+            z_offset = initial_z - base_z
             monomer.location.z = initial_z
-            bpy.context.view_layer.update()
 
             # Move down until we hit intersection
             step_size = agg_height + monomer_height
@@ -166,46 +143,88 @@ class AggregateIntersecting(Geometry):
             for _ in range(self.binary_search_steps):
                 # First move down
                 monomer.location.z -= step_size
-                bpy.context.view_layer.update()
-
-                has_intersection = self._check_intersection(monomer, aggregate)
-
-                if has_intersection:
-                    # Found intersection - done
-                    return True
+                z_offset -= step_size
+
+                shifted_min = np.array(
+                    [monomer_aabb[0], monomer_aabb[2], monomer_aabb[4] + z_offset]
+                )
+                shifted_max = np.array(
+                    [monomer_aabb[1], monomer_aabb[3], monomer_aabb[5] + z_offset]
+                )
+                candidates = np.nonzero(
+                    np.all(
+                        (placed_mins <= shifted_max) & (shifted_min <= placed_maxs),
+                        axis=1,
+                    )
+                )[0]
+
+                for idx in candidates:
+                    has_intersection = self._check_intersection(
+                        monomer,
+                        self._placed[idx],
+                        (
+                            shifted_min[0],
+                            shifted_max[0],
+                            shifted_min[1],
+                            shifted_max[1],
+                            shifted_min[2],
+                            shifted_max[2],
+                        ),
+                        (
+                            placed_mins[idx, 0],
+                            placed_maxs[idx, 0],
+                            placed_mins[idx, 1],
+                            placed_maxs[idx, 1],
+                            placed_mins[idx, 2],
+                            placed_maxs[idx, 2],
+                        ),
+                    )
+                    if has_intersection:
+                        # Found intersection - done
+                        bpy.context.view_layer.update()
+                        return True
 
                 # Halve step size for next iteration
-                step_size = step_size / 2
+                step_size *= 0.5
 
             # No intersection found - re-rotate aggregate and try again
-            agg_quat = self._random_quaternion()
-            aggregate.rotation_mode = "QUATERNION"
-            aggregate.rotation_quaternion = agg_quat
-            bpy.context.view_layer.update()
-            self._apply_rotation(aggregate)
+            self._rotate_placed(self._random_quaternion())
 
         return False
 
-    def _merge_objects(
-        self, target: bpy.types.Object, source: bpy.types.Object
-    ) -> bpy.types.Object:
-        """Merge source into target using boolean union."""
-        bpy.ops.object.select_all(action="DESELECT")
-        target.select_set(True)
-        bpy.context.view_layer.objects.active = target
+    def _merge_placed(self) -> bpy.types.Object:
+        """
+        Merge all placed monomers into the first one with a single boolean union.
 
-        bpy.ops.object.modifier_add(type="BOOLEAN")
-        boolean_mod = target.modifiers[-1]
+        The other monomers are gathered in a temporary collection that the
+        boolean takes as its operand, so the EXACT solver runs once.
+        """
+        target = self._placed[0]
+        others = self._placed[1:]
+        if not others:
+            return target
+
+        operands = bpy.data.collections.new("AggregateOperands")
+        for obj in others:
+            operands.objects.link(obj)
+
+        boolean_mod = target.modifiers.new(name="Union", type="BOOLEAN")
         boolean_mod.operation = "UNION"
-        boolean_mod.object = source
+        boolean_mod.operand_type = "COLLECTION"
+        boolean_mod.collection = operands
         boolean_mod.solver = "EXACT"
 
-        bpy.ops.object.modifier_apply(modifier=boolean_mod.name)
+        self._bake_modifier(target, boolean_mod)
+        self._invalidate_caches(target)
 
-        # Delete source object
-        bpy.ops.object.select_all(action="DESELECT")
-        source.select_set(True)
-        bpy.ops.object.delete()
+        # Delete the merged monomers and the operand collection
+        for obj in others:
+            self._invalidate_caches(obj)
+            mesh = obj.data
+            bpy.data.objects.remove(obj, do_unlink=True)
+            if mesh.users == 0:
+                bpy.data.meshes.remove(mesh)
+        bpy.data.collections.remove(operands)
 
         return target
 
@@ -220,56 +239,60 @@ class AggregateIntersecting(Geometry):
             return f"aggregate_intersecting_d{diameter_str}{seed_str}_{geom_filename}"
 
     def _create_geometry(self) -> bpy.types.Object:
-        aggregate = None
         monomer_count = 0
+        self._bbox_cache.clear()
+        self._mesh_cache.clear()
+        self._bvh_cache.clear()
+        self._placed = []
+        self._agg_bounds = None
 
         def should_continue() -> bool:
             if self.num_monomers is not None:
                 return monomer_count < self.num_monomers
             else:
-                if aggregate is None:
+                if not self._placed:
                     return True
-                diameter = self._get_max_planar_diameter(aggregate)
-                return diameter < self.target_diameter
+                agg_min, agg_max = self._agg_bounds
+                extents = agg_max - agg_min
+                # The max over the XY, XZ and YZ pairwise maxima is the largest extent
+                return float(extents.max()) < self.target_diameter
 
         while should_continue():
-            monomer = self.geometry._create_geometry()
-            monomer.name = f"Monomer_{monomer_count}"
-
-            if aggregate is None:
-                # First monomer becomes the aggregate
-                aggregate = monomer
-                aggregate.name = "Aggregate"
-                self._apply_rotation(aggregate)
-                self._apply_location(aggregate)
+            monomer = self._new_monomer(monomer_count)
+
+            if not self._placed:
+                # First monomer seeds the aggregate
+                self._apply_rotation(monomer)
+                self._apply_location(monomer)
             else:
                 # Apply random orientation to new monomer
                 quat = self._random_quaternion()
                 monomer.rotation_mode = "QUATERNION"
                 monomer.rotation_quaternion = quat
-                bpy.context.view_layer.update()
                 self._apply_rotation(monomer)
 
                 # Rotate aggregate randomly before dropping new monomer
-                agg_quat = self._random_quaternion()
-                aggregate.rotation_mode = "QUATERNION"
-                aggregate.rotation_quaternion = agg_quat
-                bpy.context.view_layer.update()
-                self._apply_rotation(aggregate)
+                self._rotate_placed(self._random_quaternion())
 
                 # Move down until intersection
-                success = self._translate_until_intersecting(monomer, aggregate)
+                success = self._translate_until_intersecting(monomer)
                 if not success:
                     raise RuntimeError(
                         f"Failed to find intersection after {self.max_retries} retries"
                     )
-                self._apply_location(monomer)
-
-                # Merge into aggregate
-                aggregate = self._merge_objects(aggregate, monomer)
 
+            self._add_placed(monomer)
             monomer_count += 1
 
+        aggregate = self._merge_placed()
+        self._placed = []
+
+        aggregate.name = "Aggregate"
+        self._apply_rotation(aggregate)
+        self._apply_location(aggregate)
+
+        self._release_template()
+
         return aggregate
 
     def generate(self) -> str:
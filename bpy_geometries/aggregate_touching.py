@@ -11,13 +11,10 @@ Algorithm:
 """
 
 import bpy
-import math
-import numpy as np
-from mathutils import Quaternion, Vector
+from ._aggregate_base import AggregateBase
 from .geometry import Geometry
 
-
-class AggregateTouching(Geometry):
+class AggregateTouching(AggregateBase):
     """
     Create an aggregate of touching monomers.
 
@@ -44,97 +41,31 @@ class AggregateTouching(Geometry):
             seed: Random seed for reproducibility
             binary_search_steps: Number of binary search iterations for positioning
         """
-        super().__init__(output_dir)
-        self.geometry = geometry
-
-        if num_monomers is None and target_diameter is None:
-            raise ValueError("Either num_monomers or target_diameter must be specified")
-        if num_monomers is not None and target_diameter is not None:
-            raise ValueError("Cannot specify both num_monomers and target_diameter")
-
-        self.num_monomers = num_monomers
-        self.target_diameter = target_diameter
-        self.seed = seed
+        super().__init__(geometry, output_dir, num_monomers, target_diameter, seed)
         self.binary_search_steps = binary_search_steps
 
-        self._rng = np.random.default_rng(seed)
-
-    def _random_quaternion(self) -> Quaternion:
-        """
-        Generate a uniformly distributed random quaternion on SO(3).
-
-        Uses the subgroup algorithm (Shoemake, 1992).
-        """
-        u1, u2, u3 = self._rng.random(3)
-
-        w = math.sqrt(1 - u1) * math.sin(2 * math.pi * u2)
-        x = math.sqrt(1 - u1) * math.cos(2 * math.pi * u2)
-        y = math.sqrt(u1) * math.sin(2 * math.pi * u3)
-        z = math.sqrt(u1) * math.cos(2 * math.pi * u3)
-
-        return Quaternion((w, x, y, z))
-
     def _get_bounding_box_z_extent(
         self, obj: bpy.types.Object
     ) -> tuple[float, float, float]:
         """Get Z extent of object's bounding box in world coordinates."""
-        bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-        z_coords = [corner.z for corner in bbox_corners]
-        return min(z_coords), max(z_coords), max(z_coords) - min(z_coords)
+        world_min, world_max = self._world_bbox(obj)
+        z_min, z_max = float(world_min[2]), float(world_max[2])
+        return z_min, z_max, z_max - z_min
 
     def _get_max_planar_diameter(self, obj: bpy.types.Object) -> float:
         """Get the maximum planar diameter (XY, XZ, or YZ) of the object."""
-        bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-        x_coords = [corner.x for corner in bbox_corners]
-        y_coords = [corner.y for corner in bbox_corners]
-        z_coords = [corner.z for corner in bbox_corners]
-
-        x_extent = max(x_coords) - min(x_coords)
-        y_extent = max(y_coords) - min(y_coords)
-        z_extent = max(z_coords) - min(z_coords)
-
-        xy_diameter = max(x_extent, y_extent)
-        xz_diameter = max(x_extent, z_extent)
-        yz_diameter = max(y_extent, z_extent)
-
-        return max(xy_diameter, xz_diameter, yz_diameter)
+        world_min, world_max = self._world_bbox(obj)
 
-    def _check_intersection(
-        self, obj1: bpy.types.Object, obj2: bpy.types.Object
-    ) -> bool:
-        """Check if two objects intersect using boolean modifier."""
-        bpy.ops.object.select_all(action="DESELECT")
-        obj1.select_set(True)
-        bpy.context.view_layer.objects.active = obj1
-
-        bpy.ops.object.modifier_add(type="BOOLEAN")
-        boolean_mod = obj1.modifiers[-1]
-        boolean_mod.operation = "INTERSECT"
-        boolean_mod.object = obj2
-        boolean_mod.solver = "EXACT"
-
-        depsgraph = bpy.context.evaluated_depsgraph_get()
-        obj_eval = obj1.evaluated_get(depsgraph)
-
-        has_intersection = len(obj_eval.data.vertices) > 0
-
-        bpy.ops.object.modifier_remove(modifier=boolean_mod.name)
-
-        return has_intersection
+        # The max over the XY, XZ and YZ pairwise maxima is the largest extent
+        return float((world_max - world_min).max())
 
     def _apply_rotation(self, obj: bpy.types.Object):
         """Apply rotation transform to object."""
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-        bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
-        obj.select_set(False)
+        self._apply_transform(obj, rotation=True)
 
     def _apply_location(self, obj: bpy.types.Object):
         """Apply location transform to object."""
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-        bpy.ops.object.transform_apply(location=True, rotation=False, scale=False)
-        obj.select_set(False)
+        self._apply_transform(obj, location=True)
 
     def _translate_until_touching(
         self, monomer: bpy.types.Object, aggregate: bpy.types.Object
@@ -142,30 +73,48 @@ class AggregateTouching(Geometry):
         """
         Binary search to find position where monomer touches aggregate.
 
+        The search starts from the AABB contact pose, so probes above the
+        aggregate are resolved by the AABB test without a boolean.
+
         Returns True if valid attachment found.
         """
-        _, _, monomer_height = self._get_bounding_box_z_extent(monomer)
-        _, agg_z_max, agg_height = self._get_bounding_box_z_extent(aggregate)
-
-        # Start with monomer well above aggregate
-        initial_z = agg_z_max + monomer_height
-        monomer.location.z = initial_z
-        bpy.context.view_layer.update()
+        monomer_aabb = self._world_aabb(monomer)
+        aggregate_aabb = self._world_aabb(aggregate)
+        monomer_height = monomer_aabb[5] - monomer_aabb[4]
+        agg_height = aggregate_aabb[5] - aggregate_aabb[4]
+
+        # Drop monomer analytically to where its AABB just clears the
+        # aggregate's AABB - the highest pose at which the meshes can touch
+        contact_offset = aggregate_aabb[5] - monomer_aabb[4] + 1e-6 * monomer_height
+        monomer.location.z += contact_offset
+        monomer_aabb = (
+            *monomer_aabb[:4],
+            monomer_aabb[4] + contact_offset,
+            monomer_aabb[5] + contact_offset,
+        )
+        z_offset = 0.0
 
         # Binary search
         step_size = (agg_height + monomer_height) / 2
 
         for _ in range(self.binary_search_steps):
-            step_size = step_size / 2
+            step_size *= 0.5
 
-            has_intersection = self._check_intersection(monomer, aggregate)
+            shifted_aabb = (
+                *monomer_aabb[:4],
+                monomer_aabb[4] + z_offset,
+                monomer_aabb[5] + z_offset,
+            )
+            has_intersection = self._check_intersection(
+                monomer, aggregate, shifted_aabb, aggregate_aabb
+            )
 
             if has_intersection:
                 monomer.location.z += step_size  # Move up (away)
+                z_offset += step_size
             else:
                 monomer.location.z -= step_size  # Move down (closer)
-
-            bpy.context.view_layer.update()
+                z_offset -= step_size
 
         # Final adjustment to ensure contact
         monomer.location.z -= step_size / 2
@@ -177,22 +126,21 @@ class AggregateTouching(Geometry):
         self, target: bpy.types.Object, source: bpy.types.Object
     ) -> bpy.types.Object:
         """Merge source into target using boolean union."""
-        bpy.ops.object.select_all(action="DESELECT")
-        target.select_set(True)
-        bpy.context.view_layer.objects.active = target
-
-        bpy.ops.object.modifier_add(type="BOOLEAN")
-        boolean_mod = target.modifiers[-1]
+        boolean_mod = target.modifiers.new(name="Union", type="BOOLEAN")
         boolean_mod.operation = "UNION"
         boolean_mod.object = source
         boolean_mod.solver = "EXACT"
 
-        bpy.ops.object.modifier_apply(modifier=boolean_mod.name)
+        self._bake_modifier(target, boolean_mod)
+
+        self._invalidate_caches(target)
+        self._invalidate_caches(source)
 
         # Delete source object
-        bpy.ops.object.select_all(action="DESELECT")
-        source.select_set(True)
-        bpy.ops.object.delete()
+        source_mesh = source.data
+        bpy.data.objects.remove(source, do_unlink=True)
+        if source_mesh.users == 0:
+            bpy.data.meshes.remove(source_mesh)
 
         return target
 
@@ -209,6 +157,9 @@ class AggregateTouching(Geometry):
     def _create_geometry(self) -> bpy.types.Object:
         aggregate = None
         monomer_count = 0
+        self._bbox_cache.clear()
+        self._mesh_cache.clear()
+        self._bvh_cache.clear()
 
         def should_continue() -> bool:
             if self.num_monomers is not None:
@@ -220,8 +171,7 @@ class AggregateTouching(Geometry):
                 return diameter < self.target_diameter
 
         while should_continue():
-            monomer = self.geometry._create_geometry()
-            monomer.name = f"Monomer_{monomer_count}"
+            monomer = self._new_monomer(monomer_count)
 
             if aggregate is None:
                 # First monomer becomes the aggregate
@@ -234,14 +184,12 @@ class AggregateTouching(Geometry):
                 quat = self._random_quaternion()
                 monomer.rotation_mode = "QUATERNION"
                 monomer.rotation_quaternion = quat
-                bpy.context.view_layer.update()
                 self._apply_rotation(monomer)
 
                 # Rotate aggregate randomly before dropping new monomer
                 agg_quat = self._random_quaternion()
                 aggregate.rotation_mode = "QUATERNION"
                 aggregate.rotation_quaternion = agg_quat
-                bpy.context.view_layer.update()
                 self._apply_rotation(aggregate)
 
                 # Binary search to find touching position
@@ -253,6 +201,8 @@ class AggregateTouching(Geometry):
 
             monomer_count += 1
 
+        self._release_template()
+
         return aggregate
 
     def generate(self) -> str:
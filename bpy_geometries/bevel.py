@@ -1,4 +1,5 @@
 import bpy
+import bmesh
 from .geometry import Geometry
 
 
@@ -12,25 +13,46 @@ class Bevel(Geometry):
         self.geometry: Geometry = geometry
         self.percent: float = percent
 
+    @property
+    def deterministic(self) -> bool:
+        """A bevel is as repeatable as the geometry it bevels."""
+        return self.geometry.deterministic
+
     def _apply_bevel_modifier(self, obj: bpy.types.Object):
         """
-        Apply a bevel modifier to the object with PERCENT width type.
+        Bevel all edges of the object with PERCENT width type.
+
+        Runs bmesh.ops.bevel on the mesh directly, equivalent to applying a
+        BEVEL modifier with 1 segment and no limit method, without the
+        modifier_apply operator and depsgraph evaluation.
 
         Args:
-            obj: The object to apply the bevel modifier to
+            obj: The object to bevel
         """
-        # Add bevel modifier
-        bevel_mod = obj.modifiers.new(name="Bevel", type="BEVEL")
-        bevel_mod.offset_type = "PERCENT"
-        bevel_mod.width_pct = self.percent
-        bevel_mod.segments = 1
-        bevel_mod.limit_method = "NONE"  # Apply to all edges
-
-        # Apply the modifier
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.modifier_apply(modifier=bevel_mod.name)
-
-        print(f"Applied bevel modifier: {self.percent}% width, 1 segment")
+        bm = bmesh.new()
+        bm.from_mesh(obj.data)
+
+        # Offset is given in percent, as for the modifier's width_pct
+        bmesh.ops.bevel(
+            bm,
+            geom=list(bm.edges),
+            offset=self.percent,
+            offset_type="PERCENT",
+            segments=1,
+            profile=0.5,
+            affect="EDGES",
+            # Modifier defaults that bmesh.ops.bevel does not share
+            clamp_overlap=True,
+            loop_slide=True,
+            miter_outer="SHARP",
+            harden_normals=False,
+        )
+
+        bm.to_mesh(obj.data)
+        bm.free()
+        obj.data.update()
+
+        print(f"Applied bevel: {self.percent}% width, 1 segment")
 
     def to_filename(self) -> str:
         """Return complete filename without extension."""
@@ -50,7 +72,7 @@ class Bevel(Geometry):
         print(f"Bevel percent: {self.percent}%")
         print()
 
-        # Apply bevel modifier
+        # Apply bevel
         self._apply_bevel_modifier(base_obj)
 
         # Export the final geometry
@@ -69,7 +91,7 @@ class Bevel(Geometry):
         print(f"Bevel percent: {self.percent}%")
         print()
 
-        # Apply bevel modifier
+        # Apply bevel
         self._apply_bevel_modifier(base_obj)
 
         return base_obj
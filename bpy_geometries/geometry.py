@@ -1,17 +1,32 @@
 import bpy
 import bmesh
+import itertools
+import math
+import numpy as np
 import os
-import uuid
 import warnings
 from abc import ABC, abstractmethod
 from mathutils.bvhtree import BVHTree
 
+# Unit (x, y) directions of hexagon vertices, in primitive_cylinder_add order
+_HEX_DIRECTIONS = tuple(
+    (math.sin(k * math.pi / 3), math.cos(k * math.pi / 3)) for k in range(6)
+)
+
 
 class Geometry(ABC):
+    # Process-wide ID source. The random start keeps IDs distinct across runs
+    # writing to the same output directory, at one entropy read per process.
+    _id_counter = itertools.count(int.from_bytes(os.urandom(4), "little"))
+
+    # True when _create_geometry builds the same mesh on every call, so callers
+    # may build it once and reuse it. Randomized geometries leave this False.
+    deterministic = False
+
     def __init__(self, output_dir: str, triangulate: bool = False):
         self.output_dir: str = output_dir
         self.triangulate: bool = triangulate
-        self._uuid: str = uuid.uuid4().hex[:8]
+        self._uuid: str = f"{next(Geometry._id_counter) & 0xFFFFFFFF:08x}"
 
     @property
     def geometry_id(self) -> str:
@@ -50,8 +65,115 @@ class Geometry(ABC):
         return f"{self.to_filename()}_{self._uuid}"
 
     def _clear_scene(self):
-        bpy.ops.object.select_all(action="SELECT")
-        bpy.ops.object.delete()
+        for obj in list(bpy.data.objects):
+            bpy.data.objects.remove(obj, do_unlink=True)
+
+        # Drop meshes orphaned by the removed objects
+        for mesh in list(bpy.data.meshes):
+            if mesh.users == 0:
+                bpy.data.meshes.remove(mesh)
+
+    def _create_hexagonal_prism(
+        self,
+        radius: float,
+        depth: float,
+        name: str = "Cylinder",
+        end_fill_type: str = "NGON",
+    ) -> bpy.types.Object:
+        """
+        Create a hexagonal prism centered at the origin without bpy.ops.
+
+        Builds the same shape as primitive_cylinder_add(vertices=6). Vertices
+        are the bottom ring then the top ring; faces are the six sides
+        followed by the caps. With end_fill_type "NGON" the caps are the top
+        then the bottom face. With "TRIFAN" each cap is a fan of six
+        triangles around a center vertex, top then bottom, and the two
+        center vertices follow the rings.
+
+        Args:
+            radius: Circumradius of the hexagon
+            depth: Length of the prism along Z
+            name: Name for the new object and mesh
+            end_fill_type: Cap fill, "NGON" or "TRIFAN"
+
+        Returns:
+            The new mesh object
+        """
+        half_depth = depth / 2.0
+
+        bm = bmesh.new()
+        bottom = [
+            bm.verts.new((radius * x, radius * y, -half_depth)) for x, y in _HEX_DIRECTIONS
+        ]
+        top = [
+            bm.verts.new((radius * x, radius * y, half_depth)) for x, y in _HEX_DIRECTIONS
+        ]
+
+        for k in range(6):
+            j = (k + 1) % 6
+            bm.faces.new((bottom[k], bottom[j], top[j], top[k]))
+
+        if end_fill_type == "TRIFAN":
+            top_center = bm.verts.new((0.0, 0.0, half_depth))
+            bottom_center = bm.verts.new((0.0, 0.0, -half_depth))
+            for k in range(6):
+                bm.faces.new((top[k], top[(k + 1) % 6], top_center))
+            for k in range(6):
+                bm.faces.new((bottom[k], bottom[(k + 1) % 6], bottom_center))
+        else:
+            bm.faces.new(top)
+            bm.faces.new(bottom)
+        bmesh.ops.recalc_face_normals(bm, faces=bm.faces[:])
+
+        return self._object_from_bmesh(bm, name)
+
+    def _object_from_bmesh(self, bm: bmesh.types.BMesh, name: str) -> bpy.types.Object:
+        """
+        Write a BMesh into a new mesh object and free the BMesh.
+
+        The object is linked to the active collection and made the only
+        selected object and the active object, as primitive operators do.
+
+        Args:
+            bm: BMesh to write; freed on return
+            name: Name for the new object and mesh
+
+        Returns:
+            The new mesh object
+        """
+        mesh = bpy.data.meshes.new(name)
+        bm.to_mesh(mesh)
+        bm.free()
+
+        obj = bpy.data.objects.new(name, mesh)
+        bpy.context.collection.objects.link(obj)
+
+        for selected in bpy.context.selected_objects:
+            selected.select_set(False)
+        obj.select_set(True)
+        bpy.context.view_layer.objects.active = obj
+
+        return obj
+
+    def _bake_modifier(self, obj: bpy.types.Object, mod: bpy.types.Modifier):
+        """
+        Bake a modifier's evaluated result into the object's mesh.
+
+        Reads the mesh from the evaluated depsgraph instead of calling
+        modifier_apply, so no operator context or selection is needed. The
+        old mesh is removed once nothing else uses it.
+
+        Args:
+            obj: Object carrying the modifier
+            mod: Modifier to bake and remove
+        """
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        new_mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+        obj.modifiers.remove(mod)
+        old_mesh = obj.data
+        obj.data = new_mesh
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
 
     def _check_self_intersection(self, obj: bpy.types.Object) -> bool:
         """
@@ -66,28 +188,22 @@ class Geometry(ABC):
         Returns:
             True if self-intersecting, False otherwise
         """
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-        bpy.ops.object.mode_set(mode="EDIT")
-
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.faces.ensure_lookup_table()
+        # Read the mesh data directly; no edit-mode round-trip is needed
+        bm = bmesh.new()
+        bm.from_mesh(obj.data)
 
         tree = BVHTree.FromBMesh(bm, epsilon=0.00001)
         overlap = tree.overlap(tree)
 
+        # Vertex indices per face, built once instead of per overlapping pair
+        face_verts = [frozenset(v.index for v in f.verts) for f in bm.faces]
+        bm.free()
+
+        # Pairs come back in both orders, so only check each once
         for i, j in overlap:
-            if i != j:
-                face_i = bm.faces[i]
-                face_j = bm.faces[j]
-                shared_verts = set(face_i.verts) & set(face_j.verts)
-                if len(shared_verts) == 0:
-                    bpy.ops.object.mode_set(mode="OBJECT")
-                    obj.select_set(False)
-                    return True
-
-        bpy.ops.object.mode_set(mode="OBJECT")
-        obj.select_set(False)
+            if i < j and face_verts[i].isdisjoint(face_verts[j]):
+                return True
+
         return False
 
     def _validate_geometry(self):
@@ -110,11 +226,13 @@ class Geometry(ABC):
         """
         Remove degenerate mesh elements (very thin triangles, zero-area faces).
 
-        This is equivalent to Blender's Edit Mode → Mesh → Cleanup → Degenerate Dissolve.
-        Operates on all mesh objects in the scene.
+        This is equivalent to Blender's Edit Mode → Mesh → Cleanup → Degenerate Dissolve,
+        but runs bmesh.ops.dissolve_degenerate on each mesh directly instead of
+        entering edit mode. Operates on all mesh objects in the scene.
         """
-        # Store current mode
-        current_mode = bpy.context.object.mode if bpy.context.object else "OBJECT"
+        # Mesh data is only current in object mode
+        if bpy.context.object and bpy.context.object.mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
 
         # Find all mesh objects
         mesh_objects = [obj for obj in bpy.data.objects if obj.type == "MESH"]
@@ -124,18 +242,41 @@ class Geometry(ABC):
 
         # Process each mesh object
         for obj in mesh_objects:
-            bpy.context.view_layer.objects.active = obj
-            bpy.ops.object.mode_set(mode="EDIT")
-            bpy.ops.mesh.select_all(action="SELECT")
+            bm = bmesh.new()
+            bm.from_mesh(obj.data)
 
             # Dissolve degenerate geometry
-            # threshold: minimum distance between elements to merge (default: 1e-4)
-            bpy.ops.mesh.dissolve_degenerate(threshold=1e-1)
+            # dist: minimum distance between elements to merge (Blender's default)
+            bmesh.ops.dissolve_degenerate(bm, dist=1e-4, edges=bm.edges[:])
 
-            bpy.ops.object.mode_set(mode="OBJECT")
+            bm.to_mesh(obj.data)
+            bm.free()
+            obj.data.update()
 
         print(f"Cleaned up degenerate faces from {len(mesh_objects)} mesh object(s)")
 
+    def _prepare_meshes_for_export(self):
+        """
+        Weld coincident vertices and, if requested, triangulate every mesh.
+
+        Boolean unions leave duplicate vertices along their seams; welding
+        them once before export gives a smaller, properly indexed OBJ.
+        Triangulating here means the exporter does not have to.
+        """
+        mesh_objects = [obj for obj in bpy.data.objects if obj.type == "MESH"]
+
+        for obj in mesh_objects:
+            bm = bmesh.new()
+            bm.from_mesh(obj.data)
+
+            bmesh.ops.remove_doubles(bm, verts=bm.verts[:], dist=1e-5)
+            if self.triangulate:
+                bmesh.ops.triangulate(bm, faces=bm.faces[:])
+
+            bm.to_mesh(obj.data)
+            bm.free()
+            obj.data.update()
+
     def _export_obj(self, filename):
         filepath = os.path.join(self.output_dir, filename)
         os.makedirs(self.output_dir, exist_ok=True)
@@ -146,10 +287,107 @@ class Geometry(ABC):
         # Clean up degenerate faces before export
         self._cleanup_degenerate_faces()
 
-        bpy.ops.wm.obj_export(
-            filepath=filepath,
-            export_selected_objects=False,
-            export_triangulated_mesh=self.triangulate,
-            export_materials=False,
-        )
+        # Weld seams and triangulate before writing
+        self._prepare_meshes_for_export()
+
+        self._write_obj(filepath)
         return filepath
+
+    def _write_obj(self, filepath: str):
+        """
+        Write the view layer's mesh objects to an OBJ file in world space.
+
+        Produces what obj_export writes for these meshes (evaluated geometry,
+        forward -Z / up Y axes, shared per-corner normals and UVs) straight
+        from the mesh arrays instead of through the exporter operator.
+        """
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        mesh_objects = [
+            obj for obj in bpy.context.view_layer.objects if obj.type == "MESH"
+        ]
+
+        # OBJ indices are 1-based and run on across objects: (v, vt, vn)
+        offsets = np.ones(3, dtype=np.int64)
+        with open(filepath, "w") as f:
+            for obj in mesh_objects:
+                obj_eval = obj.evaluated_get(depsgraph)
+                mesh = obj_eval.to_mesh()
+                try:
+                    offsets += self._write_obj_mesh(
+                        f, obj.name, mesh, np.array(obj_eval.matrix_world), offsets
+                    )
+                finally:
+                    obj_eval.to_mesh_clear()
+
+    def _write_obj_mesh(
+        self,
+        f,
+        name: str,
+        mesh: bpy.types.Mesh,
+        matrix: np.ndarray,
+        offsets: np.ndarray,
+    ) -> tuple[int, int, int]:
+        """
+        Write one mesh as an OBJ object and return its (v, vt, vn) counts.
+        """
+        num_loops = len(mesh.loops)
+        coords = np.empty((len(mesh.vertices), 3), dtype=np.float64)
+        mesh.vertices.foreach_get("co", coords.ravel())
+        loop_verts = np.empty(num_loops, dtype=np.int64)
+        mesh.loops.foreach_get("vertex_index", loop_verts)
+        loop_totals = np.empty(len(mesh.polygons), dtype=np.int64)
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+        normals = np.empty((num_loops, 3), dtype=np.float64)
+        mesh.corner_normals.foreach_get("vector", normals.ravel())
+
+        # Positions by the world matrix, normals by its inverse transpose
+        coords = coords @ matrix[:3, :3].T + matrix[:3, 3]
+        normals = normals @ np.linalg.inv(matrix[:3, :3])
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        normals /= np.where(lengths > 0.0, lengths, 1.0)
+
+        # Blender is Z-up; OBJ is Y-up with -Z forward
+        coords = np.column_stack((coords[:, 0], coords[:, 2], -coords[:, 1]))
+        normals = np.column_stack((normals[:, 0], normals[:, 2], -normals[:, 1]))
+
+        f.write(f"o {name}\n")
+        np.savetxt(f, coords, fmt="v %.6f %.6f %.6f")
+        if num_loops == 0:
+            return len(coords), 0, 0
+
+        # Corners share identical normals and UVs, as the exporter does
+        normals, normal_index = np.unique(
+            np.round(normals, 4), axis=0, return_inverse=True
+        )
+        corners = [loop_verts + offsets[0]]
+        num_uvs = 0
+        uv_layer = mesh.uv_layers.active
+        if uv_layer is not None:
+            uvs = np.empty((num_loops, 2), dtype=np.float64)
+            uv_layer.data.foreach_get("uv", uvs.ravel())
+            uvs, uv_index = np.unique(np.round(uvs, 6), axis=0, return_inverse=True)
+            np.savetxt(f, uvs, fmt="vt %.6f %.6f")
+            corners.append(uv_index.reshape(-1) + offsets[1])
+            num_uvs = len(uvs)
+        np.savetxt(f, normals, fmt="vn %.4f %.4f %.4f")
+        corners.append(normal_index.reshape(-1) + offsets[2])
+
+        # v//vn without UVs, v/vt/vn with them
+        corners = np.column_stack(corners)
+        separator = "/" if uv_layer is not None else "//"
+        corner_fmt = separator.join(["%d"] * corners.shape[1])
+        if np.all(loop_totals == 3):
+            np.savetxt(
+                f,
+                corners.reshape(-1, 3 * corners.shape[1]),
+                fmt="f " + " ".join([corner_fmt] * 3),
+            )
+        else:
+            corner_strs = [separator.join(map(str, corner)) for corner in corners]
+            starts = np.concatenate(([0], np.cumsum(loop_totals)))
+            f.writelines(
+                "f " + " ".join(corner_strs[start:end]) + "\n"
+                for start, end in zip(starts[:-1], starts[1:])
+            )
+
+        return len(coords), num_uvs, len(normals)
@@ -1,10 +1,14 @@
 import bpy
 import bmesh
 import math
+import numpy as np
+from mathutils import Vector
 from .geometry import Geometry
 
 
 class HexagonalBullet(Geometry):
+    deterministic = True
+
     def __init__(
         self,
         length: float,
@@ -28,51 +32,39 @@ class HexagonalBullet(Geometry):
         self.tolerance: float = 0.001
 
     def _create_hexagonal_column(self) -> bpy.types.Object:
-        bpy.ops.mesh.primitive_cylinder_add(
-            vertices=6,
-            radius=self.radius,
-            depth=self.length,
-            end_fill_type="NGON",
-            location=(0, 0, 0),
+        return self._create_hexagonal_prism(
+            self.radius, self.length, name="HexagonalBullet"
         )
-        obj = bpy.context.active_object
-        obj.name = "HexagonalBullet"
-        return obj
-
-    def _add_loop_cut(self, obj: bpy.types.Object):
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_all(action="SELECT")
 
-        bm = bmesh.from_edit_mesh(obj.data)
+    def _add_loop_cut(self, bm: bmesh.types.BMesh):
+        # bmesh has no foreach_get, so read each vertex and edge once into
+        # arrays and test all edges together
+        bm.verts.index_update()
         bm.edges.ensure_lookup_table()
-
-        vertical_edges = []
-        for edge in bm.edges:
-            v1, v2 = edge.verts
-            if (
-                abs(v1.co.x - v2.co.x) < self.tolerance
-                and abs(v1.co.y - v2.co.y) < self.tolerance
-            ):
-                if abs(abs(v1.co.z - v2.co.z) - self.length) < self.tolerance:
-                    vertical_edges.append(edge)
+        coords = np.array([v.co for v in bm.verts], dtype=np.float64)
+        edge_verts = np.array(
+            [(e.verts[0].index, e.verts[1].index) for e in bm.edges], dtype=np.int64
+        ).reshape(-1, 2)
+
+        delta = np.abs(coords[edge_verts[:, 0]] - coords[edge_verts[:, 1]])
+        mask = (
+            (delta[:, 0] < self.tolerance)
+            & (delta[:, 1] < self.tolerance)
+            & (np.abs(delta[:, 2] - self.length) < self.tolerance)
+        )
+        vertical_edges = [bm.edges[i] for i in np.flatnonzero(mask)]
 
         if vertical_edges:
-            bmesh.ops.subdivide_edges(
+            result = bmesh.ops.subdivide_edges(
                 bm, edges=vertical_edges, cuts=1, use_grid_fill=False
             )
 
             # The new vertices are created at z=0 (midpoint)
-            # We need to move them to the correct position
+            # Move them to the cut position above the base
             cut_z_position = -self.length / 2.0 + self.inset
-
-            # After subdivision, new vertices are at z=0
-            # Move all vertices that are near z=0 to the cut position
-            for vert in bm.verts:
-                if abs(vert.co.z) < self.tolerance:  # Vertices at the midpoint (z=0)
-                    vert.co.z = cut_z_position
-
-            bmesh.update_edit_mesh(obj.data)
+            for elem in result["geom_inner"]:
+                if isinstance(elem, bmesh.types.BMVert):
+                    elem.co.z = cut_z_position
 
     def _calculate_indentation_depth(self) -> float:
         """Calculate indentation depth from indentation_factor using same method as IndentedColumn."""
@@ -92,71 +84,53 @@ class HexagonalBullet(Geometry):
 
         return indentation_depth
 
-    def _indent_top(self, obj: bpy.types.Object):
-        bpy.ops.mesh.select_mode(type="FACE")
-        bpy.ops.mesh.select_all(action="DESELECT")
-
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.faces.ensure_lookup_table()
+    def _indent_top(self, bm: bmesh.types.BMesh):
+        bm.normal_update()
 
+        top_face = None
         for face in bm.faces:
             if (
                 abs(face.normal.x) < self.tolerance
                 and abs(face.normal.y) < self.tolerance
                 and abs(face.normal.z - 1.0) < self.tolerance
             ):
-                face.select_set(True)
+                top_face = face
                 break
-        bmesh.update_edit_mesh(obj.data)
-
-        bpy.ops.mesh.inset(thickness=(self.radius * 0.25), depth=0)
-        bpy.ops.mesh.merge(type="CENTER")
-        bpy.ops.mesh.select_mode(type="VERT")
-        bpy.context.view_layer.update()
 
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.verts.ensure_lookup_table()
-        expected_z_top = self.length / 2.0
-        indentation_depth = self._calculate_indentation_depth()
+        if top_face is None:
+            return
 
-        for v in bm.verts:
-            if (
-                abs(v.co.x) < self.tolerance
-                and abs(v.co.y) < self.tolerance
-                and abs(v.co.z - expected_z_top) < self.tolerance
-            ):
-                v.co.z -= indentation_depth
-                break
-        bmesh.update_edit_mesh(obj.data)
-
-    def _create_bullet_tip(self, obj: bpy.types.Object):
-        bpy.ops.mesh.select_all(action="DESELECT")
-        bpy.ops.mesh.select_mode(type="VERT")
-
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.verts.ensure_lookup_table()
+        # Fan the top face to a new center vertex (an inset merged at its
+        # center gives the same topology), then push that vertex down
+        result = bmesh.ops.poke(bm, faces=[top_face])
+        center = result["verts"][0]
+        center.co.z -= self._calculate_indentation_depth()
 
+    def _create_bullet_tip(self, bm: bmesh.types.BMesh):
         merge_tolerance = 0.1
         merge_threshold = -self.length / 2.0 + merge_tolerance
 
-        for v in bm.verts:
-            if v.co.z <= merge_threshold:
-                v.select_set(True)
+        tip_verts = [v for v in bm.verts if v.co.z <= merge_threshold]
+        if tip_verts:
+            merge_co = sum((v.co for v in tip_verts), Vector()) / len(tip_verts)
+            bmesh.ops.pointmerge(bm, verts=tip_verts, merge_co=merge_co)
 
-        bmesh.update_edit_mesh(obj.data)
-
-        if any(v.select for v in bm.verts):
-            bpy.ops.mesh.merge(type="CENTER")
+    def _apply_shape(self, bm: bmesh.types.BMesh):
+        """Cut, indent and point the column in a single BMesh session."""
+        self._add_loop_cut(bm)
+        self._indent_top(bm)
+        self._create_bullet_tip(bm)
 
     def _create_geometry(self) -> bpy.types.Object:
         """Create the hexagonal bullet geometry and return the object without exporting."""
         obj = self._create_hexagonal_column()
 
-        self._add_loop_cut(obj)
-        self._indent_top(obj)
-        self._create_bullet_tip(obj)
-
-        bpy.ops.object.mode_set(mode="OBJECT")
+        bm = bmesh.new()
+        bm.from_mesh(obj.data)
+        self._apply_shape(bm)
+        bm.to_mesh(obj.data)
+        bm.free()
+        obj.data.update()
 
         return obj
 
@@ -1,8 +1,9 @@
 import math
-import random
 
 import bpy
-from mathutils import Euler, Vector
+import bmesh
+import numpy as np
+from mathutils import Euler, Matrix, Quaternion, Vector
 
 from .geometry import Geometry
 from .hexagonal_bullet import HexagonalBullet
@@ -17,6 +18,7 @@ class HexagonalBulletRosette(Geometry):
         inset: float,
         num_bullets: int,
         output_dir: str,
+        seed: int = None,
     ):
         super().__init__(output_dir)
         self.length: float = length
@@ -24,115 +26,112 @@ class HexagonalBulletRosette(Geometry):
         self.indentation_factor: float = indentation_factor
         self.inset: float = inset
         self.num_bullets: int = num_bullets
-        self.rotation_factor: float = 1.0
         self.tolerance: float = 0.001
+        self.seed: int = seed
+
+        self._rng = np.random.default_rng(seed)
 
     def _compute_column_axis_vector(self, rotation_angles: tuple) -> Vector:
-        euler = Euler(rotation_angles, "XYZ")
-        rotation_matrix = euler.to_matrix()
-        local_z = Vector((0, 0, 1))
-        k_vector = rotation_matrix @ local_z
-        return k_vector
+        # Third column of R = Rz @ Ry @ Rx (XYZ Euler), i.e. R @ (0, 0, 1)
+        rx, ry, rz = rotation_angles
+        sx, cx = math.sin(rx), math.cos(rx)
+        sy, cy = math.sin(ry), math.cos(ry)
+        sz, cz = math.sin(rz), math.cos(rz)
+        return Vector(
+            (
+                cz * sy * cx + sz * sx,
+                sz * sy * cx - cz * sx,
+                cy * cx,
+            )
+        )
 
-    def _check_column_overlap(
+    def _random_axes(self, n: int) -> np.ndarray:
+        # n uniform directions on the unit sphere, shape (n, 3)
+        z = self._rng.uniform(-1.0, 1.0, n)
+        phi = self._rng.uniform(0, 2 * math.pi, n)
+        r = np.sqrt(1.0 - z * z)
+        return np.column_stack((r * np.cos(phi), r * np.sin(phi), z))
+
+    def _rotation_for_axis(self, k: Vector) -> tuple:
+        # Point the column's local Z along k, with a random spin about its own axis
+        spin = Quaternion((0, 0, 1), self._rng.uniform(0, 2 * math.pi))
+        rotation = k.to_track_quat("Z", "Y") @ spin
+        return tuple(rotation.to_euler("XYZ"))
+
+    def _overlap_cos_threshold(
         self,
-        k_new: Vector,
         radius_new: float,
         length_new: float,
-        k_existing: Vector,
         radius_existing: float,
         length_existing: float,
-    ) -> bool:
-        dot_product = k_new.dot(k_existing)
-        dot_product = max(-1.0, min(1.0, dot_product))
-        angle = math.acos(abs(dot_product))
-
-        if angle > math.pi / 2:
-            return False
-
-        angle_half = angle / 2
-        sin_half_angle = math.sin(angle_half)
+    ) -> float:
+        # Columns overlap when sin(angle / 2) < sum_radii / (2 * min_length),
+        # equivalently |cos(angle)| > 1 - 2 * (sum_radii / (2 * min_length))**2
         sum_radii = radius_new + radius_existing
         min_length = min(length_new, length_existing)
         overlap_threshold = sum_radii / (2 * min_length)
+        return 1.0 - 2.0 * overlap_threshold**2
 
-        return sin_half_angle < overlap_threshold
+    def _check_column_overlap(
+        self,
+        candidate_axes: np.ndarray,
+        existing_axes: np.ndarray,
+        cos_thresholds: np.ndarray,
+    ) -> np.ndarray:
+        # Test N candidates (N, 3) against M existing columns (M, 3) with thresholds
+        # (M,) in one product; returns whether each candidate overlaps any column.
+        # Axes are unit vectors, so |dot| <= 1 and needs no clamping.
+        cos_angles = np.abs(candidate_axes @ existing_axes.T)
+        return np.any(cos_angles > cos_thresholds, axis=1)
 
     def _find_non_overlapping_rotation(
-        self, existing_columns: list, max_attempts: int = 100
+        self,
+        existing_axes: np.ndarray,
+        cos_thresholds: np.ndarray,
+        max_attempts: int = 100,
     ) -> tuple:
-        for attempt in range(max_attempts):
-            rotation_angles = (
-                random.uniform(0, 2 * math.pi * self.rotation_factor),
-                random.uniform(0, 2 * math.pi * self.rotation_factor),
-                random.uniform(0, 2 * math.pi * self.rotation_factor),
-            )
+        # Draw every attempt at once and take the first that clears all columns
+        candidates = self._random_axes(max_attempts)
+        overlaps = self._check_column_overlap(candidates, existing_axes, cos_thresholds)
+        free = np.flatnonzero(~overlaps)
 
-            k_new = self._compute_column_axis_vector(rotation_angles)
+        if free.size:
+            return self._rotation_for_axis(Vector(candidates[free[0]])), True
 
-            overlaps = False
-            for k_existing, radius_existing, length_existing in existing_columns:
-                if self._check_column_overlap(
-                    k_new,
-                    self.radius,
-                    self.length,
-                    k_existing,
-                    radius_existing,
-                    length_existing,
-                ):
-                    overlaps = True
-                    break
+        return self._rotation_for_axis(Vector(candidates[-1])), False
 
-            if not overlaps:
-                return rotation_angles, True
-
-        return rotation_angles, False
-
-    def _create_and_orient_bullet(self, rotation_angles: tuple) -> bpy.types.Object:
+    def _create_bullet_mesh(self, bullet_gen: HexagonalBullet) -> bpy.types.Mesh:
         # Create cylinder directly without clearing scene
-        bpy.ops.mesh.primitive_cylinder_add(
-            vertices=6,
-            radius=self.radius,
-            depth=self.length,
-            end_fill_type="NGON",
-            location=(0, 0, 0),
-        )
-        obj = bpy.context.active_object
-        obj.name = "HexagonalBullet"
-
-        # Create a bullet generator to use its methods
-        bullet_gen = HexagonalBullet(
-            length=self.length,
-            radius=self.radius,
-            indentation_factor=self.indentation_factor,
-            inset=self.inset,
-            output_dir=self.output_dir,
+        obj = self._create_hexagonal_prism(
+            self.radius, self.length, name="HexagonalBullet"
         )
 
         # Apply bullet shaping
-        bullet_gen._add_loop_cut(obj)
-        bullet_gen._indent_top(obj)
-        bullet_gen._create_bullet_tip(obj)
-        bpy.ops.object.mode_set(mode="OBJECT")
+        bm = bmesh.new()
+        bm.from_mesh(obj.data)
+        bullet_gen._apply_shape(bm)
+        bm.to_mesh(obj.data)
+        bm.free()
 
         # Now we need to position the bullet so the non-indented base is at origin
         # The non-indented base is at z = -length/2 in the bullet's local coordinates
         # We need to translate it up by length/2
-        obj.location.z += self.length / 2.0
-
-        # Set origin to world origin for proper rotation
-        bpy.context.scene.cursor.location = (0.0, 0.0, 0.0)
-        bpy.ops.object.select_all(action="DESELECT")
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.origin_set(type="ORIGIN_CURSOR")
-
-        # Apply rotation
-        obj.rotation_euler = rotation_angles
-
-        # Apply transforms
-        bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
-
+        translation = Matrix.Translation((0.0, 0.0, self.length / 2.0))
+        obj.data.transform(translation @ obj.matrix_basis)
+        obj.data.update()
+
+        # Keep only the shaped mesh; every bullet links it with its own rotation
+        mesh = obj.data
+        bpy.data.objects.remove(obj, do_unlink=True)
+        return mesh
+
+    def _place_bullet(
+        self, mesh: bpy.types.Mesh, rotation_angles: tuple, name: str
+    ) -> bpy.types.Object:
+        # Rotation about the world origin lives on the object, not in the mesh
+        obj = bpy.data.objects.new(name, mesh)
+        bpy.context.collection.objects.link(obj)
+        obj.matrix_basis = Euler(rotation_angles).to_matrix().to_4x4()
         return obj
 
     def _merge_vertices_by_distance(self, obj: bpy.types.Object, merge_distance: float):
@@ -160,30 +159,50 @@ class HexagonalBulletRosette(Geometry):
         """Create the hexagonal bullet rosette geometry and return the object without exporting."""
         self._clear_scene()
 
-        existing_columns = []
+        existing_axes = np.empty((0, 3))
+        cos_thresholds = np.empty(0)
         bullets_created = 0
+        bullets = []
 
-        # Create first bullet with random rotation
-        first_rotation = (
-            random.uniform(0, 2 * math.pi * self.rotation_factor),
-            random.uniform(0, 2 * math.pi * self.rotation_factor),
-            random.uniform(0, 2 * math.pi * self.rotation_factor),
+        # One bullet generator shared by all bullets, for its shaping methods
+        bullet_gen = HexagonalBullet(
+            length=self.length,
+            radius=self.radius,
+            indentation_factor=self.indentation_factor,
+            inset=self.inset,
+            output_dir=self.output_dir,
+        )
+
+        # Every bullet has the same dimensions, so the overlap threshold is shared
+        cos_threshold = self._overlap_cos_threshold(
+            self.radius, self.length, self.radius, self.length
         )
 
+        # Create first bullet with random rotation
+        first_rotation = self._rotation_for_axis(Vector(self._random_axes(1)[0]))
+
+        # Shape a single bullet once; all bullets share its mesh
+        bullet_mesh = self._create_bullet_mesh(bullet_gen)
+
         print(f"Creating bullet 1/{self.num_bullets}")
-        aggregate = self._create_and_orient_bullet(first_rotation)
-        aggregate.name = "BulletRosetteAggregate"
+        aggregate = self._place_bullet(
+            bullet_mesh.copy(), first_rotation, "BulletRosetteAggregate"
+        )
+        # The aggregate receives the union, so its rotation is baked into its own mesh
+        aggregate.data.transform(aggregate.matrix_basis)
+        aggregate.matrix_basis = Matrix.Identity(4)
         bullets_created += 1
 
         # Track first bullet
         first_k_vector = self._compute_column_axis_vector(first_rotation)
-        existing_columns.append((first_k_vector, self.radius, self.length))
+        existing_axes = np.vstack((existing_axes, first_k_vector))
+        cos_thresholds = np.append(cos_thresholds, cos_threshold)
 
         # Add additional bullets
         for i in range(1, self.num_bullets):
             print(f"\nAttempting to create bullet {i + 1}/{self.num_bullets}")
             rotation_angles, success = self._find_non_overlapping_rotation(
-                existing_columns
+                existing_axes, cos_thresholds
             )
 
             if not success:
@@ -193,16 +212,25 @@ class HexagonalBulletRosette(Geometry):
                 continue  # Skip this bullet if we can't find a good rotation
 
             print(f"Creating bullet {i + 1} with rotation {rotation_angles}")
-            new_bullet = self._create_and_orient_bullet(rotation_angles)
-            new_bullet.name = f"Bullet_{i + 1}"
+            new_bullet = self._place_bullet(
+                bullet_mesh, rotation_angles, f"Bullet_{i + 1}"
+            )
             bullets_created += 1
 
             # Track new bullet
             k_vector = self._compute_column_axis_vector(rotation_angles)
-            existing_columns.append((k_vector, self.radius, self.length))
+            existing_axes = np.vstack((existing_axes, k_vector))
+            cos_thresholds = np.append(cos_thresholds, cos_threshold)
+
+            bullets.append(new_bullet)
+
+        # Union all bullets with the aggregate in a single boolean pass
+        if bullets:
+            print(f"\nApplying Boolean union for {len(bullets)} bullets")
+            operands = bpy.data.collections.new("RosetteBullets")
+            for bullet in bullets:
+                operands.objects.link(bullet)
 
-            # Join with aggregate using Boolean union
-            print(f"Applying Boolean union for bullet {i + 1}")
             bpy.ops.object.select_all(action="DESELECT")
             aggregate.select_set(True)
             bpy.context.view_layer.objects.active = aggregate
@@ -211,12 +239,11 @@ class HexagonalBulletRosette(Geometry):
             vert_count_before = len(aggregate.data.vertices)
             print(f"  Aggregate vertices before union: {vert_count_before}")
 
-            bpy.ops.object.modifier_add(type="BOOLEAN")
-            boolean_mod = aggregate.modifiers[-1]
-            boolean_mod.name = f"UnionBullet{i + 1}"
+            boolean_mod = aggregate.modifiers.new(name="UnionBullets", type="BOOLEAN")
             boolean_mod.operation = "UNION"
-            boolean_mod.object = new_bullet
-            boolean_mod.solver = "FAST"  # Try FAST solver
+            boolean_mod.operand_type = "COLLECTION"
+            boolean_mod.collection = operands
+            boolean_mod.solver = "EXACT"
 
             try:
                 bpy.ops.object.modifier_apply(modifier=boolean_mod.name)
@@ -229,16 +256,13 @@ class HexagonalBulletRosette(Geometry):
             except Exception as e:
                 print(f"  ERROR applying Boolean modifier: {e}")
 
-            # Delete the bullet object after union
-            bpy.ops.object.select_all(action="DESELECT")
-            new_bullet.select_set(True)
-            bpy.ops.object.delete()
+            # Delete the bullet objects after union
+            for bullet in bullets:
+                bpy.data.objects.remove(bullet, do_unlink=True)
+            bpy.data.collections.remove(operands)
 
-            # Re-get the aggregate object since references can be lost
-            aggregate = bpy.context.scene.objects.get("BulletRosetteAggregate")
-            if not aggregate:
-                print(f"  ERROR: Lost reference to aggregate object!")
-                break
+        if bullet_mesh.users == 0:
+            bpy.data.meshes.remove(bullet_mesh)
 
         # Final cleanup
         print(f"\nTotal bullets created: {bullets_created}/{self.num_bullets}")
@@ -258,7 +282,8 @@ class HexagonalBulletRosette(Geometry):
         """Return complete filename without extension."""
         indentation_str = f"{self.indentation_factor:.2f}".replace(".", "p")
         inset_str = f"{self.inset:.2f}".replace(".", "p")
-        return f"hexagonal_bullet_rosette_n{self.num_bullets}_l{self.length}_r{self.radius}_indentfactor{indentation_str}_inset{inset_str}"
+        seed_str = f"_s{self.seed}" if self.seed is not None else ""
+        return f"hexagonal_bullet_rosette_n{self.num_bullets}_l{self.length}_r{self.radius}_indentfactor{indentation_str}_inset{inset_str}{seed_str}"
 
     def generate(self) -> str:
         obj = self._create_geometry()
@@ -3,6 +3,8 @@ from .geometry import Geometry
 
 
 class HexagonalColumn(Geometry):
+    deterministic = True
+
     def __init__(self, length: float, radius: float, output_dir: str):
         super().__init__(output_dir)
         self.length: float = length
@@ -10,10 +12,7 @@ class HexagonalColumn(Geometry):
 
     def _create_geometry(self) -> bpy.types.Object:
         """Create the hexagonal column geometry and return the object without exporting."""
-        bpy.ops.mesh.primitive_cylinder_add(
-            vertices=6, radius=self.radius, depth=self.length, location=(0, 0, 0)
-        )
-        return bpy.context.active_object
+        return self._create_hexagonal_prism(self.radius, self.length)
 
     def to_filename(self) -> str:
         """Return complete filename without extension."""
@@ -1,7 +1,7 @@
 import bpy
-import random
+import bmesh
 import math
-from mathutils import Euler, Vector
+import numpy as np
 from .geometry import Geometry
 
 
@@ -11,12 +11,31 @@ class Inclusions(Geometry):
         geometry: Geometry,
         num_inclusions: int,
         inclusion_radius: float,
+        seed: int = None,
+        verbose: bool = False,
     ):
         super().__init__(geometry.output_dir)
         self.geometry: Geometry = geometry
         self.num_inclusions: int = num_inclusions
         self.inclusion_radius: float = inclusion_radius
         self.inclusion_height: float = inclusion_radius * 3 * math.sqrt(3) / 4
+        self.seed: int = seed
+        self.verbose: bool = verbose
+        self._rng = np.random.default_rng(seed)
+
+        # Triangular pyramid with its centroid at the origin: base triangle
+        # h/4 below, apex 3h/4 above; faces wound outward
+        angles = np.arange(3) * (2 * math.pi / 3)
+        base = np.column_stack(
+            (
+                inclusion_radius * np.sin(angles),
+                inclusion_radius * np.cos(angles),
+                np.full(3, -self.inclusion_height / 4),
+            )
+        )
+        apex = (0.0, 0.0, 3 * self.inclusion_height / 4)
+        self._pyramid_verts = np.vstack((base, apex))
+        self._pyramid_faces = [(1, 0, 3), (2, 1, 3), (0, 2, 3), (0, 1, 2)]
 
     def _calculate_bounding_box(self, obj: bpy.types.Object) -> tuple:
         """
@@ -25,81 +44,42 @@ class Inclusions(Geometry):
         Returns:
             tuple: (min_x, max_x, min_y, max_y, min_z, max_z)
         """
-        # Get bounding box corners in world coordinates
-        bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-
-        min_x = min(corner.x for corner in bbox_corners)
-        max_x = max(corner.x for corner in bbox_corners)
-        min_y = min(corner.y for corner in bbox_corners)
-        max_y = max(corner.y for corner in bbox_corners)
-        min_z = min(corner.z for corner in bbox_corners)
-        max_z = max(corner.z for corner in bbox_corners)
+        # Bound the vertices themselves: bound_box lags behind mesh edits
+        # made without a depsgraph evaluation
+        mesh = obj.data
+        coords = np.empty((len(mesh.vertices), 3), dtype=np.float64)
+        mesh.vertices.foreach_get("co", coords.ravel())
+        matrix = np.array(obj.matrix_world)
+        coords_world = coords @ matrix[:3, :3].T + matrix[:3, 3]
+        min_x, min_y, min_z = coords_world.min(axis=0).tolist()
+        max_x, max_y, max_z = coords_world.max(axis=0).tolist()
 
         return (min_x, max_x, min_y, max_y, min_z, max_z)
 
-    def _create_triangular_pyramid(self, name: str) -> bpy.types.Object:
-        """
-        Create a triangular pyramid using a Cone primitive with 3 vertices.
-
-        Returns:
-            bpy.types.Object: The created pyramid object
-        """
-        bpy.ops.mesh.primitive_cone_add(
-            vertices=3,
-            radius1=self.inclusion_radius,
-            depth=self.inclusion_height,
-            location=(0, 0, 0),
-        )
-        pyramid = bpy.context.active_object
-        pyramid.name = name
-        return pyramid
-
-    def _get_center_of_mass(self, obj: bpy.types.Object):
+    def _euler_xyz_matrices(self, angles: np.ndarray) -> np.ndarray:
         """
-        Calculate the center of mass of the object.
-
-        Returns:
-            Vector: The center of mass in world coordinates
-        """
-        # For a cone, Blender places the origin at the base center by default
-        # For a pyramid with height h, the center of mass is at h/4 from base
-        # Since the cone is created along Z-axis with base at origin
-        # We need to adjust for the actual geometry
-
-        # Use Blender's built-in bound_box to get the geometric center
-        bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-        center = sum(
-            (corner for corner in bbox_corners), start=bbox_corners[0].copy()
-        ) / len(bbox_corners)
-        return center
-
-    def _random_position_in_bbox(self, bbox: tuple):
-        """
-        Generate a random position within the bounding box.
+        Build rotation matrices for a batch of XYZ Euler angles.
 
         Args:
-            bbox: (min_x, max_x, min_y, max_y, min_z, max_z)
+            angles: (N, 3) array of X, Y, Z rotations in radians
 
         Returns:
-            tuple: (x, y, z) random position
+            np.ndarray: (N, 3, 3) matrices equal to Euler(angles, "XYZ").to_matrix()
         """
-        min_x, max_x, min_y, max_y, min_z, max_z = bbox
-        x = random.uniform(min_x, max_x)
-        y = random.uniform(min_y, max_y)
-        z = random.uniform(min_z, max_z)
-        return (x, y, z)
-
-    def _random_orientation(self):
-        """
-        Generate random Euler angles for random 3D orientation.
-
-        Returns:
-            Euler: Random rotation angles
-        """
-        x = random.uniform(0, 2 * math.pi)
-        y = random.uniform(0, 2 * math.pi)
-        z = random.uniform(0, 2 * math.pi)
-        return Euler((x, y, z), "XYZ")
+        cx, cy, cz = np.cos(angles).T
+        sx, sy, sz = np.sin(angles).T
+
+        matrices = np.empty((len(angles), 3, 3))
+        matrices[:, 0, 0] = cy * cz
+        matrices[:, 0, 1] = sx * sy * cz - cx * sz
+        matrices[:, 0, 2] = cx * sy * cz + sx * sz
+        matrices[:, 1, 0] = cy * sz
+        matrices[:, 1, 1] = sx * sy * sz + cx * cz
+        matrices[:, 1, 2] = cx * sy * sz - sx * cz
+        matrices[:, 2, 0] = -sy
+        matrices[:, 2, 1] = sx * cy
+        matrices[:, 2, 2] = cx * cy
+        return matrices
 
     def _apply_boolean_difference(
         self, target_obj: bpy.types.Object, subtract_obj: bpy.types.Object
@@ -111,20 +91,23 @@ class Inclusions(Geometry):
             target_obj: The object to modify
             subtract_obj: The object to subtract from target_obj
         """
-        # Add boolean modifier
+        # Add boolean modifier; the cutter may overlap itself, so let the
+        # solver resolve self-intersections
         bool_mod = target_obj.modifiers.new(name="Boolean", type="BOOLEAN")
         bool_mod.operation = "DIFFERENCE"
         bool_mod.object = subtract_obj
+        bool_mod.use_self = True
 
-        # Apply the modifier
-        bpy.context.view_layer.objects.active = target_obj
-        bpy.ops.object.modifier_apply(modifier=bool_mod.name)
+        self._bake_modifier(target_obj, bool_mod)
 
     def to_filename(self) -> str:
         """Return complete filename without extension."""
         geom_filename = self.geometry.to_filename()
         radius_str = f"{self.inclusion_radius:.1f}".replace(".", "p")
-        return f"inclusions_n{self.num_inclusions}_r{radius_str}_{geom_filename}"
+        seed_str = f"_s{self.seed}" if self.seed is not None else ""
+        return (
+            f"inclusions_n{self.num_inclusions}_r{radius_str}{seed_str}_{geom_filename}"
+        )
 
     def generate(self) -> str:
         """
@@ -149,51 +132,49 @@ class Inclusions(Geometry):
         )
         print()
 
-        # Create a single pyramid that we'll reuse
-        pyramid = self._create_triangular_pyramid("InclusionPyramid")
+        # Sample every position and orientation up front
+        positions = self._rng.uniform(
+            low=bbox[0::2], high=bbox[1::2], size=(self.num_inclusions, 3)
+        )
+        rotations = self._rng.uniform(0, 2 * math.pi, size=(self.num_inclusions, 3))
+
+        # Place every pyramid at once: rotate about its centroid by
+        # R = Rz @ Ry @ Rx (Blender's XYZ Euler order), then translate
+        rot_matrices = self._euler_xyz_matrices(rotations)
+        placed = (
+            np.einsum("nij,vj->nvi", rot_matrices, self._pyramid_verts)
+            + positions[:, None, :]
+        )
 
-        # Process each inclusion
+        # Accumulate every placed pyramid into one BMesh so the base mesh is
+        # cut by a single boolean instead of one per inclusion
+        bm = bmesh.new()
         for i in range(self.num_inclusions):
-            print(f"Processing inclusion {i + 1}/{self.num_inclusions}")
-
-            # Get current center of mass
-            current_center = self._get_center_of_mass(pyramid)
-
-            # Generate random target position and orientation
-            target_pos = self._random_position_in_bbox(bbox)
-            random_rot = self._random_orientation()
-
-            # Calculate translation needed to move center of mass to target
-            translation = (
-                target_pos[0] - current_center.x,
-                target_pos[1] - current_center.y,
-                target_pos[2] - current_center.z,
-            )
-
-            # Apply rotation first (around current center)
-            pyramid.rotation_euler = random_rot
-
-            # Then translate to target position
-            pyramid.location = (
-                pyramid.location.x + translation[0],
-                pyramid.location.y + translation[1],
-                pyramid.location.z + translation[2],
-            )
-
-            print(
-                f"  Position: ({target_pos[0]:.2f}, {target_pos[1]:.2f}, {target_pos[2]:.2f})"
-            )
-            print(
-                f"  Rotation: ({random_rot.x:.2f}, {random_rot.y:.2f}, {random_rot.z:.2f})"
-            )
-
-            # Apply boolean difference
-            self._apply_boolean_difference(base_obj, pyramid)
-            print(f"  Applied boolean difference")
-
-        # Delete the pyramid helper geometry
-        bpy.data.objects.remove(pyramid, do_unlink=True)
-        print(f"\nDeleted inclusion helper geometry")
+            verts = [bm.verts.new(co) for co in placed[i].tolist()]
+            for face in self._pyramid_faces:
+                bm.faces.new([verts[k] for k in face])
+
+            if self.verbose:
+                target_pos = positions[i]
+                random_rot = rotations[i]
+                print(f"Processing inclusion {i + 1}/{self.num_inclusions}")
+                print(
+                    f"  Position: ({target_pos[0]:.2f}, {target_pos[1]:.2f}, {target_pos[2]:.2f})"
+                )
+                print(
+                    f"  Rotation: ({random_rot[0]:.2f}, {random_rot[1]:.2f}, {random_rot[2]:.2f})"
+                )
+
+        # Apply one boolean difference for all inclusions
+        cutters = self._object_from_bmesh(bm, "InclusionCutters")
+        self._apply_boolean_difference(base_obj, cutters)
+        print(f"\nApplied boolean difference for {self.num_inclusions} inclusions")
+
+        # Delete the inclusion helper geometry
+        cutter_mesh = cutters.data
+        bpy.data.objects.remove(cutters, do_unlink=True)
+        bpy.data.meshes.remove(cutter_mesh)
+        print(f"Deleted inclusion helper geometry")
 
         # Export the final geometry
         filename = f"{self.get_full_filename()}.obj"
@@ -1,10 +1,16 @@
 import bpy
-import bmesh
 import math
 from .geometry import Geometry
 
 
 class IndentedColumn(Geometry):
+    # Cap center vertex indices of a TRIFAN _create_hexagonal_prism: two
+    # rings of six, then the top and bottom centers
+    _TOP_CENTER = 12
+    _BOTTOM_CENTER = 13
+
+    deterministic = True
+
     def __init__(
         self, length: float, radius: float, indentation_amount: float, output_dir: str
     ):
@@ -39,126 +45,66 @@ class IndentedColumn(Geometry):
         return indentation_depth
 
     def _create_cylinder(self, name: str) -> bpy.types.Object:
-        bpy.ops.mesh.primitive_cylinder_add(
-            vertices=6,
-            radius=self.radius,
-            depth=self.length,
-            end_fill_type="NGON",
-            location=(0, 0, 0),
+        return self._create_hexagonal_prism(
+            self.radius, self.length, name=name, end_fill_type="TRIFAN"
         )
-        obj = bpy.context.active_object
-        obj.name = name
-        return obj
 
-    def _indent_top(self, obj: bpy.types.Object, indentation_depth: float):
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_mode(type="FACE")
-        bpy.ops.mesh.select_all(action="DESELECT")
-
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.faces.ensure_lookup_table()
-
-        for face in bm.faces:
-            if (
-                abs(face.normal.x) < self.tolerance
-                and abs(face.normal.y) < self.tolerance
-                and abs(face.normal.z - 1.0) < self.tolerance
-            ):
-                face.select_set(True)
-                break
-
-        bmesh.update_edit_mesh(obj.data)
-
-        bpy.ops.mesh.inset(thickness=(self.radius * 0.25), depth=0)
-        bpy.ops.mesh.merge(type="CENTER")
-        bpy.ops.mesh.select_mode(type="VERT")
-        bpy.context.view_layer.update()
-
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.verts.ensure_lookup_table()
-
-        expected_z = self.length / 2.0
-        for v in bm.verts:
-            if (
-                abs(v.co.x) < self.tolerance
-                and abs(v.co.y) < self.tolerance
-                and abs(v.co.z - expected_z) < self.tolerance
-            ):
-                v.co.z -= indentation_depth
-                break
-
-        bmesh.update_edit_mesh(obj.data)
-        bpy.ops.object.mode_set(mode="OBJECT")
-
-    def _indent_bottom(self, obj: bpy.types.Object, indentation_depth: float):
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_mode(type="FACE")
-        bpy.ops.mesh.select_all(action="DESELECT")
-
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.faces.ensure_lookup_table()
-
-        for face in bm.faces:
-            if (
-                abs(face.normal.x) < self.tolerance
-                and abs(face.normal.y) < self.tolerance
-                and abs(face.normal.z - (-1.0)) < self.tolerance
-            ):
-                face.select_set(True)
-                break
-
-        bmesh.update_edit_mesh(obj.data)
-
-        bpy.ops.mesh.inset(thickness=(self.radius * 0.25), depth=0)
-        bpy.ops.mesh.merge(type="CENTER")
-        bpy.ops.mesh.select_mode(type="VERT")
-        bpy.context.view_layer.update()
-
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.verts.ensure_lookup_table()
-
-        expected_z = -self.length / 2.0
-        for v in bm.verts:
-            if (
-                abs(v.co.x) < self.tolerance
-                and abs(v.co.y) < self.tolerance
-                and abs(v.co.z - expected_z) < self.tolerance
-            ):
-                v.co.z += indentation_depth
-                break
-
-        bmesh.update_edit_mesh(obj.data)
-        bpy.ops.object.mode_set(mode="OBJECT")
+    def _indent_cap(
+        self, obj: bpy.types.Object, z_sign: float, indentation_depth: float
+    ):
+        # The fan center of the cap facing z_sign is the apex of the
+        # indentation; push it inward
+        center = self._TOP_CENTER if z_sign > 0 else self._BOTTOM_CENTER
+        obj.data.vertices[center].co.z -= z_sign * indentation_depth
+        obj.data.update()
 
     def _create_geometry(self) -> bpy.types.Object:
         """Create the indented column geometry and return the object without exporting."""
         indentation_depth = self._calculate_indentation_depth()
 
+        # While the two indentation cones stay apart, intersecting a
+        # top-indented and a bottom-indented prism is the same as indenting
+        # both caps of one prism, so the boolean is only needed once they
+        # would cross
+        if indentation_depth < self.length / 2:
+            obj = self._create_cylinder("IndentedColumn")
+            self._indent_cap(obj, 1.0, indentation_depth)
+            self._indent_cap(obj, -1.0, indentation_depth)
+        else:
+            obj = self._intersect_indented_cylinders(indentation_depth)
+
+        obj.select_set(True)
+        bpy.context.view_layer.objects.active = obj
+
+        obj.name = "IndentedColumn"
+        return obj
+
+    def _intersect_indented_cylinders(
+        self, indentation_depth: float
+    ) -> bpy.types.Object:
         obj_A = self._create_cylinder("Cylinder_TopIndented")
         obj_B = self._create_cylinder("Cylinder_BottomIndented")
 
-        self._indent_top(obj_A, indentation_depth)
-        self._indent_bottom(obj_B, indentation_depth)
-
-        bpy.ops.object.select_all(action="DESELECT")
-        obj_A.select_set(True)
-        bpy.context.view_layer.objects.active = obj_A
+        self._indent_cap(obj_A, 1.0, indentation_depth)
+        self._indent_cap(obj_B, -1.0, indentation_depth)
 
-        bpy.ops.object.modifier_add(type="BOOLEAN")
-        boolean_mod = obj_A.modifiers[-1]
-        boolean_mod.name = "IntersectionWithB"
+        boolean_mod = obj_A.modifiers.new(name="IntersectionWithB", type="BOOLEAN")
         boolean_mod.operation = "INTERSECT"
         boolean_mod.object = obj_B
+        # Once the indentation reaches the far cap, the apex pokes through it
+        # and each operand self-intersects. The manifold solver needs clean
+        # manifold operands, so only EXACT handles that case.
+        if indentation_depth < self.length:
+            boolean_mod.solver = "MANIFOLD"
+        else:
+            boolean_mod.solver = "EXACT"
 
-        bpy.ops.object.modifier_apply(modifier=boolean_mod.name)
+        self._bake_modifier(obj_A, boolean_mod)
 
-        bpy.ops.object.select_all(action="DESELECT")
-        obj_B.select_set(True)
-        bpy.ops.object.delete()
+        mesh_B = obj_B.data
+        bpy.data.objects.remove(obj_B, do_unlink=True)
+        bpy.data.meshes.remove(mesh_B)
 
-        obj_A.name = "IndentedColumn"
         return obj_A
 
     def to_filename(self) -> str:
@@ -1,6 +1,6 @@
 import bpy
 import bmesh
-import random
+import numpy as np
 from .geometry import Geometry
 
 
@@ -11,77 +11,90 @@ class Roughened(Geometry):
         max_edge_length: float,
         displacement_sigma: float,
         merge_distance: float,
+        seed: int = None,
     ):
         super().__init__(geometry.output_dir)
         self.geometry: Geometry = geometry
         self.max_edge_length: float = max_edge_length
         self.displacement_sigma: float = displacement_sigma
         self.merge_distance: float = merge_distance
+        self.seed: int = seed
+        self._rng = np.random.default_rng(seed)
 
     def subdivide_until_max_edge_length(self, obj: bpy.types.Object):
         """
         Subdivide mesh edges until all edges are <= max_edge_length.
 
-        Algorithm:
-        1. Initial triangulation with FIXED method
-        2. Check all edges
-        3. If any edge > max_edge_length, subdivide once
-        4. Triangulate all faces with BEAUTY method
-        5. Repeat until no edges exceed max_edge_length
+        Algorithm (longest-edge bisection in rounds):
+        1. Triangulate all faces
+        2. Collect the edges longer than max_edge_length
+        3. Going longest first, keep each edge whose adjacent triangles are
+           untouched so far this round, so every triangle has at most one
+           edge split
+        4. Split the kept edges at their midpoints in one operator call,
+           joining each midpoint to the opposite vertex of its triangles
+        5. Measure only the edges the split created or shortened, and
+           repeat until no edge exceeds max_edge_length
         """
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-
-        # Perform initial triangulation with FIXED algorithm
-        bpy.ops.mesh.select_all(action="SELECT")
-        bpy.ops.mesh.quads_convert_to_tris(quad_method="BEAUTY", ngon_method="CLIP")
-
-        max_iterations = 100
-        iteration = 0
-
-        while iteration < max_iterations:
-            bpy.ops.mesh.select_all(action="DESELECT")
-
-            # Get mesh data
-            bm = bmesh.from_edit_mesh(obj.data)
-            bm.edges.ensure_lookup_table()
-
-            # Check if any edges exceed max length
-            edges_to_subdivide = []
-            max_edge_found = 0.0
-
-            for edge in bm.edges:
-                edge_length = edge.calc_length()
-                if edge_length > self.max_edge_length:
-                    edges_to_subdivide.append(edge)
-                    edge.select = True
-                    max_edge_found = max(max_edge_found, edge_length)
-
-            bmesh.update_edit_mesh(obj.data)
-
-            # If no edges exceed max length, we're done
-            if not edges_to_subdivide:
-                print(f"Subdivision complete after {iteration} iterations")
-                break
+        bm = bmesh.new()
+        bm.from_mesh(obj.data)
+        bmesh.ops.triangulate(
+            bm, faces=bm.faces[:], quad_method="BEAUTY", ngon_method="CLIP"
+        )
 
-            print(
-                f"Iteration {iteration + 1}: Found {len(edges_to_subdivide)} edges to subdivide (max: {max_edge_found:.4f})"
+        # Lengths of the edges still to split. Splitting a triangle along its
+        # median leaves its other edges unchanged, so after each round only
+        # the split halves and the new inner edges need measuring
+        long_edges = {
+            edge: length
+            for edge in bm.edges
+            if (length := edge.calc_length()) > self.max_edge_length
+        }
+
+        num_splits = 0
+        num_rounds = 0
+        while long_edges:
+            ordered = sorted(long_edges.items(), key=lambda item: item[1], reverse=True)
+
+            # Every BMesh operator call touches the whole mesh, so split as
+            # many edges as possible per call
+            touched = set()
+            batch = []
+            for edge, _ in ordered:
+                faces = edge.link_faces
+                if any(face in touched for face in faces):
+                    continue
+                touched.update(faces)
+                batch.append(edge)
+
+            for edge in batch:
+                del long_edges[edge]
+
+            result = bmesh.ops.subdivide_edges(
+                bm, edges=batch, cuts=1, use_single_edge=True
             )
-
-            # Subdivide selected edges once
-            bpy.ops.mesh.subdivide(number_cuts=1)
-
-            # Triangulate all faces using BEAUTY algorithm for subsequent iterations
-            # quad_method options: 'BEAUTY', 'FIXED', 'FIXED_ALTERNATE', 'SHORTEST_DIAGONAL', 'LONG_EDGE'
-            bpy.ops.mesh.select_all(action="SELECT")
-            bpy.ops.mesh.quads_convert_to_tris(quad_method="SHORTEST_DIAGONAL")
-
-            iteration += 1
-
-        if iteration >= max_iterations:
-            print(f"Warning: Reached maximum iterations ({max_iterations})")
-
-        bpy.ops.object.mode_set(mode="OBJECT")
+            num_splits += len(batch)
+            num_rounds += 1
+
+            # The split edge lives on as one of its halves, so measure it again
+            # along with everything the split created
+            new_edges = [
+                elem
+                for elem in batch + result["geom_split"] + result["geom_inner"]
+                if isinstance(elem, bmesh.types.BMEdge) and elem.is_valid
+            ]
+            for edge in new_edges:
+                length = edge.calc_length()
+                if length > self.max_edge_length:
+                    long_edges[edge] = length
+
+        bm.to_mesh(obj.data)
+        bm.free()
+        obj.data.update()
+        print(
+            f"Subdivision complete after {num_splits} edge splits "
+            f"in {num_rounds} rounds"
+        )
 
     def apply_random_displacement(self, obj: bpy.types.Object):
         """
@@ -93,32 +106,28 @@ class Roughened(Geometry):
             print("Displacement sigma is 0.0, skipping displacement")
             return
 
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
+        mesh = obj.data
+        num_verts = len(mesh.vertices)
 
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.verts.ensure_lookup_table()
-        bm.normal_update()
+        # Vertex data is stored as float32, so read and write it as such
+        coords = np.empty((num_verts, 3), dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords.ravel())
+        normals = np.empty((num_verts, 3), dtype=np.float32)
+        mesh.vertex_normals.foreach_get("vector", normals.ravel())
 
-        displaced_count = 0
+        # Displace every vertex along its normal by random(-sigma, sigma)
+        displacement = self._rng.uniform(
+            -self.displacement_sigma, self.displacement_sigma, size=(num_verts, 1)
+        ).astype(np.float32)
+        normals *= displacement
+        coords += normals
 
-        for vert in bm.verts:
-            # Generate random displacement value between -sigma and +sigma
-            displacement_amount = random.uniform(
-                -self.displacement_sigma, self.displacement_sigma
-            )
-
-            # Displace vertex along its normal
-            vert.co += vert.normal * displacement_amount
-            displaced_count += 1
-
-        bmesh.update_edit_mesh(obj.data)
+        mesh.vertices.foreach_set("co", coords.ravel())
+        mesh.update()
         print(
-            f"Applied random displacement to {displaced_count} vertices (sigma={self.displacement_sigma})"
+            f"Applied random displacement to {num_verts} vertices (sigma={self.displacement_sigma})"
         )
 
-        bpy.ops.object.mode_set(mode="OBJECT")
-
     def merge_vertices_by_distance(self, obj: bpy.types.Object):
         """
         Merge vertices that are within merge_distance of each other.
@@ -127,22 +136,22 @@ class Roughened(Geometry):
             print("Merge distance is <= 0.0, skipping vertex merge")
             return
 
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_all(action="SELECT")
-
         # Merge vertices by distance
-        bpy.ops.mesh.remove_doubles(threshold=self.merge_distance)
-
-        bpy.ops.object.mode_set(mode="OBJECT")
+        bm = bmesh.new()
+        bm.from_mesh(obj.data)
+        bmesh.ops.remove_doubles(bm, verts=bm.verts[:], dist=self.merge_distance)
+        bm.to_mesh(obj.data)
+        bm.free()
+        obj.data.update()
         print(f"Merged vertices within distance {self.merge_distance}")
 
     def to_filename(self) -> str:
         """Return complete filename without extension."""
         sigma_str = f"{self.displacement_sigma:.1f}".replace(".", "p")
         merge_str = f"{self.merge_distance:.1f}".replace(".", "p")
+        seed_str = f"_s{self.seed}" if self.seed is not None else ""
         geom_filename = self.geometry.to_filename()
-        return f"roughened_edge{self.max_edge_length}_sigma{sigma_str}_merge{merge_str}_{geom_filename}"
+        return f"roughened_edge{self.max_edge_length}_sigma{sigma_str}_merge{merge_str}{seed_str}_{geom_filename}"
 
     def generate(self) -> str:
         """
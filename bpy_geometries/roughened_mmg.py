@@ -7,20 +7,24 @@ followed by vertex displacement along normals and vertex merging.
 Requires mmgs binary - see vendor/README.md for installation instructions.
 """
 
+import functools
+import hashlib
 import os
-import re
 import shutil
 import subprocess
 import tempfile
 from pathlib import Path
 
+import bmesh
 import bpy
 import meshio
 import numpy as np
+from mathutils.kdtree import KDTree
 
 from .geometry import Geometry
 
 
+@functools.lru_cache(maxsize=1)
 def _find_mmgs_binary() -> Path | None:
     """
     Find mmgs binary in standard locations.
@@ -30,7 +34,9 @@ def _find_mmgs_binary() -> Path | None:
     2. {repo}/vendor/mmg/build/bin/mmgs_O3
     3. System PATH (via shutil.which)
 
-    Returns Path to binary or None if not found.
+    Returns Path to binary or None if not found. The result is cached for
+    the process; call _find_mmgs_binary.cache_clear() after changing the
+    environment.
     """
     # 1. Environment variable
     env_path = os.environ.get("BPY_GEOMETRIES_MMGS_PATH")
@@ -53,6 +59,48 @@ def _find_mmgs_binary() -> Path | None:
     return None
 
 
+def _mmgs_options(hmax: float, hmin: float = 0.0) -> list[str]:
+    """Command-line options for an mmgs refinement run, without the input file."""
+    hmin_args = ["-hmin", str(hmin)] if 0.0 < hmin < hmax else []
+    return ["-hmax", str(hmax), *hmin_args, "-nomove", "-ar", "1"]
+
+
+def _mmgs_cache_path(
+    mesh_path: Path, mmgs_path: Path, options: list[str]
+) -> Path | None:
+    """
+    Path of the cached mmgs output for an input .mesh file, or None.
+
+    Caching is opt-in: it is enabled by pointing BPY_GEOMETRIES_CACHE_DIR at
+    a directory. The key hashes the input file bytes, the mmgs binary's path
+    and modification time, and the command-line options, so a change to the
+    base geometry, the mmgs build or the refinement settings misses the
+    cache.
+    """
+    cache_root = os.environ.get("BPY_GEOMETRIES_CACHE_DIR")
+    if not cache_root:
+        return None
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(mesh_path.read_bytes())
+    resolved = mmgs_path.resolve()
+    digest.update(f"{resolved} {resolved.stat().st_mtime_ns}".encode())
+    digest.update("\0".join(options).encode())
+
+    return Path(cache_root) / "mmgs" / f"{digest.hexdigest()}.mesh"
+
+
+def _store_in_cache(source: Path, cache_path: Path) -> None:
+    """Copy a file into the cache atomically; failures only skip caching."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        partial = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        shutil.copyfile(source, partial)
+        os.replace(partial, cache_path)
+    except OSError as e:
+        print(f"Could not cache mmgs output: {e}")
+
+
 class RoughenedMMG(Geometry):
     """
     Apply surface roughness using MMG mesh refinement.
@@ -63,7 +111,8 @@ class RoughenedMMG(Geometry):
 
     MMG produces better quality meshes than Blender's subdivision,
     with isotropic triangulation that respects the specified maximum
-    edge length.
+    edge length. The merge distance is passed to mmgs as the minimum edge
+    length, so refinement does not create edges that merging would collapse.
 
     Requires mmgs binary to be installed. See vendor/README.md for
     installation instructions.
@@ -148,12 +197,12 @@ class RoughenedMMG(Geometry):
 
     def _compute_vertex_normals(self, mesh: meshio.Mesh) -> np.ndarray:
         """
-        Compute per-vertex normals by averaging adjacent face normals.
+        Compute per-vertex normals by summing area-weighted face normals.
 
-        Returns array of shape (n_vertices, 3) with unit normals.
+        Returns array of shape (n_vertices, 3) with unit normals, in the
+        dtype of the mesh points.
         """
         points = mesh.points
-        normals = np.zeros_like(points)
 
         # Find triangle cells
         triangles = None
@@ -165,15 +214,24 @@ class RoughenedMMG(Geometry):
         if triangles is None:
             raise ValueError("No triangles found in mesh")
 
-        # Accumulate face normals at each vertex
-        for tri in triangles:
-            v0, v1, v2 = points[tri[0]], points[tri[1]], points[tri[2]]
-            face_normal = np.cross(v1 - v0, v2 - v0)
-            norm = np.linalg.norm(face_normal)
-            if norm > 1e-10:
-                face_normal /= norm
-            for idx in tri:
-                normals[idx] += face_normal
+        # Unnormalized cross products have length 2 * area, so summing them
+        # weights each face by its area
+        tri_points = points[triangles]
+        face_normals = np.cross(
+            tri_points[:, 1] - tri_points[:, 0], tri_points[:, 2] - tri_points[:, 0]
+        )
+
+        # Scatter each face normal to its three corners with one buffered
+        # bincount per axis (np.add.at is unbuffered and much slower)
+        corners = triangles.ravel()
+        corner_normals = np.repeat(face_normals, 3, axis=0)
+        num_points = len(points)
+        normals = np.column_stack(
+            [
+                np.bincount(corners, corner_normals[:, axis], minlength=num_points)
+                for axis in range(3)
+            ]
+        ).astype(points.dtype, copy=False)
 
         # Normalize
         norms = np.linalg.norm(normals, axis=1, keepdims=True)
@@ -187,59 +245,120 @@ class RoughenedMMG(Geometry):
         if sigma == 0.0:
             return mesh
 
+        # Draw offsets in [-sigma, sigma) straight into float32, then scale
+        # the freshly computed normals and add them in place
+        offsets = self._rng.random((len(mesh.points), 1), dtype=np.float32)
+        offsets *= 2.0 * sigma
+        offsets -= sigma
+
         normals = self._compute_vertex_normals(mesh)
-        displacements = self._rng.uniform(-sigma, sigma, size=len(mesh.points))
-        mesh.points = mesh.points + normals * displacements[:, np.newaxis]
+        normals *= offsets
+        mesh.points += normals
 
         return mesh
 
-    def _merge_close_vertices(self, mesh: meshio.Mesh, merge_distance: float) -> meshio.Mesh:
+    def _merge_close_vertices(
+        self, points: np.ndarray, triangles: np.ndarray, merge_distance: float
+    ) -> tuple[np.ndarray, np.ndarray]:
         """Merge vertices within merge_distance of each other."""
         if merge_distance <= 0:
-            return mesh
+            return points, triangles
+
+        num_points = len(points)
+        coords = points.tolist()
+
+        kd = KDTree(num_points)
+        for i, co in enumerate(coords):
+            kd.insert(co, i)
+        kd.balance()
+
+        # Union vertices within merge_distance; each cluster is represented
+        # by its lowest index
+        parent = list(range(num_points))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i, co in enumerate(coords):
+            for _, j, dist in kd.find_range(co, merge_distance):
+                if j > i and dist < merge_distance:
+                    root_i, root_j = find(i), find(j)
+                    if root_i != root_j:
+                        parent[max(root_i, root_j)] = min(root_i, root_j)
+
+        # Jump every vertex to its cluster root, all vertices at once
+        merged_to = np.array(parent)
+        while True:
+            jumped = merged_to[merged_to]
+            if np.array_equal(jumped, merged_to):
+                break
+            merged_to = jumped
 
-        points = mesh.points
-        merged_to = np.arange(len(points))
-
-        # Find vertices to merge
-        for i in range(len(points)):
-            if merged_to[i] != i:
-                continue
-            for j in range(i + 1, len(points)):
-                if merged_to[j] != j:
-                    continue
-                if np.linalg.norm(points[i] - points[j]) < merge_distance:
-                    merged_to[j] = i
-
-        # Build new vertex list
-        unique_indices = np.where(merged_to == np.arange(len(points)))[0]
+        # Roots become the new vertex list; the inverse maps old to new
+        unique_indices, old_to_new = np.unique(merged_to, return_inverse=True)
         new_points = points[unique_indices]
 
-        # Build index mapping
-        old_to_new = np.zeros(len(points), dtype=int)
-        for new_idx, old_idx in enumerate(unique_indices):
-            old_to_new[old_idx] = new_idx
-        for i in range(len(points)):
-            if merged_to[i] != i:
-                old_to_new[i] = old_to_new[merged_to[i]]
+        # Remap triangles and remove degenerate ones
+        new_triangles = old_to_new[triangles]
+        valid = (
+            (new_triangles[:, 0] != new_triangles[:, 1])
+            & (new_triangles[:, 1] != new_triangles[:, 2])
+            & (new_triangles[:, 0] != new_triangles[:, 2])
+        )
 
-        # Remap cells and remove degenerate triangles
-        new_cells = []
-        for cell_block in mesh.cells:
-            new_data = old_to_new[cell_block.data]
-            if cell_block.type == "triangle":
-                # Remove triangles where any two vertices are the same
-                valid = (
-                    (new_data[:, 0] != new_data[:, 1])
-                    & (new_data[:, 1] != new_data[:, 2])
-                    & (new_data[:, 0] != new_data[:, 2])
-                )
-                new_data = new_data[valid]
-            new_cells.append(meshio.CellBlock(cell_block.type, new_data))
-
-        return meshio.Mesh(new_points, new_cells)
-
-    def _run_mmgs(self, input_path: Path, output_dir: Path, hmax: float) -> Path | None:
+        return new_points, new_triangles[valid]
+
+    def _write_mmg_mesh(self, mesh: meshio.Mesh, mesh_path: Path) -> None:
+        """
+        Write the mesh triangles to a Medit .mesh file for mmgs.
+
+        Every vertex and triangle ref is written as 0, which mmgs needs
+        (meshio's writer would emit 1/-1 refs that have to be patched).
+        """
+        triangles = np.concatenate(
+            [cb.data for cb in mesh.cells if cb.type == "triangle"]
+        )
+
+        with open(mesh_path, "w") as f:
+            f.write("MeshVersionFormatted 2\nDimension 3\n\n")
+            f.write(f"Vertices\n{len(mesh.points)}\n")
+            np.savetxt(f, mesh.points, fmt="%.17g %.17g %.17g 0")
+            f.write(f"\nTriangles\n{len(triangles)}\n")
+            np.savetxt(f, triangles + 1, fmt="%d %d %d 0")
+            f.write("\nEnd\n")
+
+    def _read_mmg_mesh(self, mesh_path: Path) -> meshio.Mesh:
+        """
+        Read the vertices and triangles of an mmgs Medit .mesh output file.
+
+        Each section is a keyword line, a count line and one entry per line;
+        sections other than Vertices and Triangles are skipped.
+        """
+        with open(mesh_path, "r") as f:
+            lines = f.read().splitlines()
+
+        blocks = {}
+        i = 0
+        while i < len(lines):
+            keyword = lines[i].strip()
+            i += 1
+            if keyword in ("Vertices", "Triangles"):
+                count = int(lines[i])
+                blocks[keyword] = np.loadtxt(lines[i + 1 : i + 1 + count], ndmin=2)
+                i += 1 + count
+
+        # Single precision is ample for roughening and halves the traffic of
+        # every later pass over the vertices
+        points = np.ascontiguousarray(blocks["Vertices"][:, :3], dtype=np.float32)
+        triangles = blocks["Triangles"][:, :3].astype(np.int64) - 1
+        return meshio.Mesh(points, [meshio.CellBlock("triangle", triangles)])
+
+    def _run_mmgs(
+        self, input_path: Path, output_dir: Path, hmax: float, hmin: float = 0.0
+    ) -> Path | None:
         """
         Run mmgs on input mesh file.
 
@@ -247,19 +366,15 @@ class RoughenedMMG(Geometry):
             input_path: Path to input .mesh file
             output_dir: Directory for output
             hmax: Maximum edge length
+            hmin: Minimum edge length; ignored unless 0 < hmin < hmax
 
         Returns:
             Path to output .mesh file, or None on failure
         """
         result = subprocess.run(
-            [
-                str(self._mmgs_path),
-                "-hmax", str(hmax),
-                "-nomove",
-                "-ar", "1",
-                str(input_path),
-            ],
-            capture_output=True,
+            [str(self._mmgs_path), *_mmgs_options(hmax, hmin), str(input_path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             cwd=output_dir,
         )
@@ -276,27 +391,21 @@ class RoughenedMMG(Geometry):
 
         return output_files[0]
 
-    def _roughen_mesh(self, input_obj_path: Path, output_obj_path: Path) -> bool:
+    def _roughen_mesh(
+        self, mesh: meshio.Mesh
+    ) -> tuple[np.ndarray, np.ndarray] | None:
         """
         Roughen a mesh using MMG refinement and displacement.
 
         Args:
-            input_obj_path: Path to input OBJ file
-            output_obj_path: Path for output OBJ file
+            mesh: Triangulated input mesh
 
         Returns:
-            True on success, False on failure
+            (points, triangles) of the roughened mesh, or None on failure
         """
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp_dir = Path(tmp_dir)
 
-            # Read input mesh
-            try:
-                mesh = meshio.read(str(input_obj_path))
-            except Exception as e:
-                print(f"Error reading mesh: {e}")
-                return False
-
             # Compute absolute values from percentages
             _, _, max_dim = self._get_mesh_bounds(mesh)
 
@@ -318,91 +427,89 @@ class RoughenedMMG(Geometry):
             # Write to MESH format for MMG
             mesh_file = tmp_dir / "input.mesh"
             try:
-                meshio.write(str(mesh_file), mesh)
+                self._write_mmg_mesh(mesh, mesh_file)
             except Exception as e:
                 print(f"Error writing MESH file: {e}")
-                return False
-
-            # Fix ref values (MMG quirk - needs 0 instead of 1/-1)
-            with open(mesh_file, "r") as f:
-                content = f.read()
-            content = re.sub(r" 1$", " 0", content, flags=re.MULTILINE)
-            content = re.sub(r" -1$", " 0", content, flags=re.MULTILINE)
-            with open(mesh_file, "w") as f:
-                f.write(content)
+                return None
 
-            # Run MMG refinement
-            refined_path = self._run_mmgs(mesh_file, tmp_dir, hmax)
-            if refined_path is None:
-                return False
+            # Reuse a cached refinement of identical input, else run MMG.
+            # Refining below the merge distance only makes edges that the
+            # merge pass would collapse again
+            cache_path = _mmgs_cache_path(
+                mesh_file, self._mmgs_path, _mmgs_options(hmax, merge_dist)
+            )
+            if cache_path is not None and cache_path.exists():
+                refined_path = cache_path
+            else:
+                refined_path = self._run_mmgs(mesh_file, tmp_dir, hmax, hmin=merge_dist)
+                if refined_path is None:
+                    return None
+                if cache_path is not None:
+                    _store_in_cache(refined_path, cache_path)
 
             # Read refined mesh
             try:
-                refined_mesh = meshio.read(str(refined_path))
+                refined_mesh = self._read_mmg_mesh(refined_path)
             except Exception as e:
                 print(f"Error reading refined mesh: {e}")
-                return False
+                return None
 
             # Apply displacement and merge
             refined_mesh = self._apply_displacement(refined_mesh, sigma)
-            refined_mesh = self._merge_close_vertices(refined_mesh, merge_dist)
+            points, triangles = self._merge_close_vertices(
+                refined_mesh.points,
+                refined_mesh.get_cells_type("triangle"),
+                merge_dist,
+            )
 
-            # Write output OBJ
-            try:
-                # Keep only triangles
-                triangle_cells = [
-                    cb for cb in refined_mesh.cells if cb.type == "triangle"
-                ]
-                if not triangle_cells:
-                    print("No triangles in output mesh")
-                    return False
-
-                output_mesh = meshio.Mesh(refined_mesh.points, triangle_cells)
-                meshio.write(str(output_obj_path), output_mesh)
-            except Exception as e:
-                print(f"Error writing output OBJ: {e}")
-                return False
-
-        return True
-
-    def _export_base_geometry(self, obj: bpy.types.Object, output_path: Path) -> None:
-        """Export Blender object to triangulated OBJ."""
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-
-        # Triangulate
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_all(action="SELECT")
-        bpy.ops.mesh.quads_convert_to_tris(quad_method="BEAUTY", ngon_method="BEAUTY")
-        bpy.ops.object.mode_set(mode="OBJECT")
-
-        # Export
-        bpy.ops.wm.obj_export(
-            filepath=str(output_path),
-            export_selected_objects=True,
-            export_triangulated_mesh=True,
-            export_normals=False,
-            export_uv=False,
-            export_materials=False,
+            if len(triangles) == 0:
+                print("No triangles in output mesh")
+                return None
+
+        return points, triangles
+
+    def _triangle_mesh_from_object(self, obj: bpy.types.Object) -> meshio.Mesh:
+        """Read the object's triangulated mesh in world space into arrays."""
+        mesh = obj.data
+        mesh.calc_loop_triangles()
+
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords)
+        coords = coords.reshape(-1, 3)
+
+        # matrix_basis needs no depsgraph update (objects are unparented)
+        matrix = np.array(obj.matrix_basis, dtype=np.float32)
+        points = coords @ matrix[:3, :3].T + matrix[:3, 3]
+
+        triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("vertices", triangles)
+        triangles = triangles.reshape(-1, 3)
+
+        return meshio.Mesh(points, [meshio.CellBlock("triangle", triangles)])
+
+    def _object_from_arrays(
+        self, points: np.ndarray, triangles: np.ndarray, name: str
+    ) -> bpy.types.Object:
+        """Build a mesh object from vertex and triangle arrays."""
+        mesh = bpy.data.meshes.new(name)
+        mesh.vertices.add(len(points))
+        mesh.vertices.foreach_set("co", points.astype(np.float32).ravel())
+        mesh.loops.add(triangles.size)
+        mesh.loops.foreach_set("vertex_index", triangles.astype(np.int32).ravel())
+        mesh.polygons.add(len(triangles))
+        mesh.polygons.foreach_set(
+            "loop_start", np.arange(0, triangles.size, 3, dtype=np.int32)
         )
-        obj.select_set(False)
-
-    def _import_obj(self, obj_path: Path, name: str) -> bpy.types.Object:
-        """Import OBJ file into Blender and fix normals."""
-        bpy.ops.wm.obj_import(filepath=str(obj_path))
-        obj = bpy.context.selected_objects[0]
-        obj.name = name
+        mesh.polygons.foreach_set("loop_total", np.full(len(triangles), 3, np.int32))
+        mesh.update(calc_edges=True)
 
         # Fix face orientation (MMG/meshio can flip winding)
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_all(action="SELECT")
-        bpy.ops.mesh.normals_make_consistent(inside=False)
-        bpy.ops.object.mode_set(mode="OBJECT")
-        obj.select_set(False)
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+        bpy.data.meshes.remove(mesh)
+        bmesh.ops.recalc_face_normals(bm, faces=bm.faces[:])
 
-        return obj
+        return self._object_from_bmesh(bm, name)
 
     def to_filename(self) -> str:
         """Return filename parameters without extension or UUID."""
@@ -432,27 +539,19 @@ class RoughenedMMG(Geometry):
                 f"The geometry class must implement _create_geometry()."
             )
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_dir = Path(tmp_dir)
-
-            # Export base geometry
-            pristine_path = tmp_dir / "pristine.obj"
-            self._export_base_geometry(base_obj, pristine_path)
-
-            # Remove base object from scene
-            bpy.data.objects.remove(base_obj, do_unlink=True)
-
-            # Roughen
-            roughened_path = tmp_dir / "roughened.obj"
-            success = self._roughen_mesh(pristine_path, roughened_path)
+        # Read the base geometry straight from Blender
+        base_mesh = self._triangle_mesh_from_object(base_obj)
 
-            if not success:
-                raise RuntimeError("MMG roughening failed")
+        # Remove base object from scene
+        bpy.data.objects.remove(base_obj, do_unlink=True)
 
-            # Import roughened mesh
-            obj = self._import_obj(roughened_path, "RoughenedMMG")
+        # Roughen
+        roughened = self._roughen_mesh(base_mesh)
+        if roughened is None:
+            raise RuntimeError("MMG roughening failed")
 
-        return obj
+        points, triangles = roughened
+        return self._object_from_arrays(points, triangles, "RoughenedMMG")
 
     def generate(self) -> str:
         """Generate the roughened geometry and export to OBJ file."""
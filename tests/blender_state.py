@@ -0,0 +1,35 @@
+"""
+Shared Blender state helpers for the test scripts.
+"""
+
+import os
+
+import bpy
+
+
+def get_output_dir() -> str:
+    """
+    Directory the tests write OBJ files to.
+
+    Defaults to tests/output; set BPY_GEOMETRIES_TEST_OUTPUT to redirect it,
+    e.g. to a tmpfs path such as /dev/shm to keep test output off disk.
+    """
+    default = os.path.join(os.path.dirname(__file__), "output")
+    return os.environ.get("BPY_GEOMETRIES_TEST_OUTPUT", default)
+
+
+def reset_scene():
+    """
+    Remove the datablocks tests create without reloading factory settings.
+
+    Reloading rebuilds all of Blender's state; generation only ever adds
+    objects, meshes and materials, so purging those is enough.
+    """
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+
+    for material in list(bpy.data.materials):
+        bpy.data.materials.remove(material)
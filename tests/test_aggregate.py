@@ -3,9 +3,7 @@
 Test aggregate geometry generation.
 """
 
-import os
-import bpy
-
+from blender_state import get_output_dir, reset_scene
 from bpy_geometries.hexagonal_column import HexagonalColumn
 from bpy_geometries.indented_column import IndentedColumn
 from bpy_geometries.hexagonal_bullet import HexagonalBullet
@@ -14,9 +12,9 @@ from bpy_geometries.roughened import Roughened
 
 
 def test_aggregate_hexagonal_column():
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    reset_scene()
 
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
+    output_dir = get_output_dir()
 
     aggregate = Aggregate(
         geometry=HexagonalColumn(length=20.0, radius=7.0, output_dir=output_dir),
@@ -28,10 +26,31 @@ def test_aggregate_hexagonal_column():
     print(f"Generated aggregate hexagonal column: {filepath}")
 
 
+def test_aggregate_seeded():
+    output_dir = get_output_dir()
+
+    # The same seed must place the monomers identically
+    seeded_coords = []
+    for _ in range(2):
+        reset_scene()
+        aggregate = Aggregate(
+            geometry=HexagonalColumn(length=20.0, radius=7.0, output_dir=output_dir),
+            num_monomers=5,
+            output_dir=output_dir,
+            seed=42,
+        )
+        obj = aggregate._create_geometry()
+        seeded_coords.append([tuple(v.co) for v in obj.data.vertices])
+
+    assert "_s42_" in aggregate.to_filename()
+    assert seeded_coords[0] == seeded_coords[1]
+    print(f"Seeded aggregate reproducible ({len(seeded_coords[0])} vertices)")
+
+
 def test_roughened_aggregate_hexagonal_column():
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    reset_scene()
 
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
+    output_dir = get_output_dir()
 
     aggregate = Roughened(
         Aggregate(
@@ -49,9 +68,9 @@ def test_roughened_aggregate_hexagonal_column():
 
 
 def test_aggregate_indented_column():
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    reset_scene()
 
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
+    output_dir = get_output_dir()
 
     aggregate = Aggregate(
         geometry=IndentedColumn(
@@ -66,9 +85,9 @@ def test_aggregate_indented_column():
 
 
 def test_aggregate_hexagonal_bullet():
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    reset_scene()
 
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
+    output_dir = get_output_dir()
 
     aggregate = Aggregate(
         geometry=HexagonalBullet(
@@ -100,9 +119,12 @@ if __name__ == "__main__":
     print("\nTest 3: Aggregate Hexagonal Bullet")
     test_aggregate_hexagonal_bullet()
 
-    print("\nTest 3: Roughened Hexagonal Column")
+    print("\nTest 4: Roughened Hexagonal Column")
     test_roughened_aggregate_hexagonal_column()
 
+    print("\nTest 5: Seeded Aggregate")
+    test_aggregate_seeded()
+
     print("\n" + "=" * 80)
     print("All aggregate tests completed successfully!")
     print("=" * 80)
@@ -4,8 +4,8 @@ Test AggregateIntersecting geometry generation.
 """
 
 import os
-import bpy
 
+from blender_state import get_output_dir, reset_scene
 from bpy_geometries.hexagonal_column import HexagonalColumn
 from bpy_geometries.indented_column import IndentedColumn
 from bpy_geometries.aggregate_intersecting import AggregateIntersecting
@@ -13,9 +13,9 @@ from bpy_geometries.roughened import Roughened
 
 
 def test_aggregate_intersecting_hexagonal_column():
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    reset_scene()
 
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
+    output_dir = get_output_dir()
 
     aggregate = AggregateIntersecting(
         geometry=HexagonalColumn(length=20.0, radius=7.0, output_dir=output_dir),
@@ -30,9 +30,9 @@ def test_aggregate_intersecting_hexagonal_column():
 
 
 def test_aggregate_intersecting_with_target_diameter():
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    reset_scene()
 
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
+    output_dir = get_output_dir()
 
     aggregate = AggregateIntersecting(
         geometry=HexagonalColumn(length=10.0, radius=3.0, output_dir=output_dir),
@@ -47,9 +47,9 @@ def test_aggregate_intersecting_with_target_diameter():
 
 
 def test_aggregate_intersecting_indented_column():
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    reset_scene()
 
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
+    output_dir = get_output_dir()
 
     aggregate = AggregateIntersecting(
         geometry=IndentedColumn(
@@ -66,9 +66,9 @@ def test_aggregate_intersecting_indented_column():
 
 
 def test_roughened_aggregate_intersecting():
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    reset_scene()
 
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
+    output_dir = get_output_dir()
 
     aggregate = Roughened(
         AggregateIntersecting(
@@ -3,9 +3,7 @@
 Test bevel geometry generation with Bevel wrapper.
 """
 
-import os
-import bpy
-
+from blender_state import get_output_dir, reset_scene
 from bpy_geometries.hexagonal_column import HexagonalColumn
 from bpy_geometries.indented_column import IndentedColumn
 from bpy_geometries.hexagonal_bullet import HexagonalBullet
@@ -14,11 +12,11 @@ from bpy_geometries.bevel import Bevel
 
 
 if __name__ == "__main__":
-    # Initialize Blender
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    # Start from an empty scene
+    reset_scene()
 
     # Set output directory
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
+    output_dir = get_output_dir()
 
     print("=" * 80)
     print("Running Bevel Geometry Tests")
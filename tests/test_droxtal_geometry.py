@@ -3,21 +3,28 @@
 Test Droxtal geometry generation with basic, roughened, beveled, and inclusion variants.
 """
 
-import os
-import bpy
+import functools
 
+from blender_state import get_output_dir, reset_scene
 from bpy_geometries.droxtal import Droxtal
 from bpy_geometries.roughened import Roughened
 from bpy_geometries.bevel import Bevel
 from bpy_geometries.inclusions import Inclusions
 
+OUTPUT_DIR = get_output_dir()
+
+
+@functools.lru_cache(maxsize=1)
+def _base_droxtal() -> Droxtal:
+    """Droxtal shared by every test; each wrapper builds its own mesh from it."""
+    return Droxtal(radius=14.365, output_dir=OUTPUT_DIR)
+
 
 def test_basic_droxtal():
     """Test basic droxtal geometry generation."""
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    reset_scene()
 
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
-    droxtal = Droxtal(radius=14.365, output_dir=output_dir)
+    droxtal = _base_droxtal()
 
     filepath = droxtal.generate()
     print(f"Generated basic droxtal: {filepath}")
@@ -29,10 +36,9 @@ def test_basic_droxtal():
 
 def test_roughened_droxtal():
     """Test droxtal with surface roughening."""
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    reset_scene()
 
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
-    base_droxtal = Droxtal(radius=14.365, output_dir=output_dir)
+    base_droxtal = _base_droxtal()
 
     rough_droxtal = Roughened(
         geometry=base_droxtal,
@@ -47,10 +53,9 @@ def test_roughened_droxtal():
 
 def test_beveled_droxtal():
     """Test droxtal with beveled edges."""
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    reset_scene()
 
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
-    base_droxtal = Droxtal(radius=14.365, output_dir=output_dir)
+    base_droxtal = _base_droxtal()
 
     beveled_droxtal = Bevel(
         geometry=base_droxtal,
@@ -63,10 +68,9 @@ def test_beveled_droxtal():
 
 def test_droxtal_with_inclusions():
     """Test droxtal with air bubble inclusions."""
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    reset_scene()
 
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
-    base_droxtal = Droxtal(radius=14.365, output_dir=output_dir)
+    base_droxtal = _base_droxtal()
 
     droxtal_inclusions = Inclusions(
         geometry=base_droxtal,
@@ -80,10 +84,9 @@ def test_droxtal_with_inclusions():
 
 def test_combined_droxtal():
     """Test droxtal with multiple modifiers: beveled + roughened."""
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    reset_scene()
 
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
-    base_droxtal = Droxtal(radius=14.365, output_dir=output_dir)
+    base_droxtal = _base_droxtal()
 
     # First apply bevel
     beveled_droxtal = Bevel(
@@ -3,9 +3,7 @@
 Test basic geometry generation without roughness.
 """
 
-import os
-import bpy
-
+from blender_state import get_output_dir, reset_scene
 from bpy_geometries.hexagonal_column import HexagonalColumn
 from bpy_geometries.indented_column import IndentedColumn
 from bpy_geometries.hexagonal_bullet import HexagonalBullet
@@ -13,9 +11,9 @@ from bpy_geometries.hexagonal_bullet_rosette import HexagonalBulletRosette
 
 
 def test_hexagonal_column():
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    reset_scene()
 
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
+    output_dir = get_output_dir()
     column = HexagonalColumn(length=10.0, radius=2.0, output_dir=output_dir)
 
     filepath = column.generate()
@@ -23,9 +21,9 @@ def test_hexagonal_column():
 
 
 def test_indented_column():
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    reset_scene()
 
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
+    output_dir = get_output_dir()
     column = IndentedColumn(
         length=10.0, radius=2.0, indentation_amount=0.5, output_dir=output_dir
     )
@@ -35,9 +33,9 @@ def test_indented_column():
 
 
 def test_hexagonal_bullet():
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    reset_scene()
 
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
+    output_dir = get_output_dir()
     bullet = HexagonalBullet(
         length=10.0,
         radius=1.0,
@@ -51,9 +49,9 @@ def test_hexagonal_bullet():
 
 
 def test_bullet_rosette():
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    reset_scene()
 
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
+    output_dir = get_output_dir()
     rosette = HexagonalBulletRosette(
         length=10.0,
         radius=1.0,
@@ -67,6 +65,39 @@ def test_bullet_rosette():
     print(f"Generated bullet rosette: {filepath}")
 
 
+def test_obj_export_contents():
+    reset_scene()
+
+    output_dir = get_output_dir()
+    column = HexagonalColumn(length=10.0, radius=2.0, output_dir=output_dir)
+
+    filepath = column.generate()
+    with open(filepath) as f:
+        records = [line.split() for line in f if line.strip()]
+
+    vertices = [[float(x) for x in r[1:]] for r in records if r[0] == "v"]
+    normals = [r for r in records if r[0] == "vn"]
+    faces = [r[1:] for r in records if r[0] == "f"]
+
+    # Six side quads and two hexagonal caps, each with its own flat normal
+    assert len(vertices) == 12
+    assert len(normals) == 8
+    assert sorted(len(face) for face in faces) == [4] * 6 + [6] * 2
+
+    # Every corner references a written vertex and normal as v//vn
+    for face in faces:
+        for corner in face:
+            v, vt, vn = corner.split("/")
+            assert vt == ""
+            assert 1 <= int(v) <= len(vertices)
+            assert 1 <= int(vn) <= len(normals)
+
+    # The column axis (Blender Z) is written as OBJ Y
+    heights = [v[1] for v in vertices]
+    assert abs(min(heights) + 5.0) < 1e-5 and abs(max(heights) - 5.0) < 1e-5
+    print(f"Parsed {filepath}: {len(vertices)} v, {len(normals)} vn, {len(faces)} f")
+
+
 if __name__ == "__main__":
     print("=" * 80)
     print("Running Geometry Tests")
@@ -84,6 +115,9 @@ if __name__ == "__main__":
     print("\nTest 4: Hexagonal Bullet Rosette")
     test_bullet_rosette()
 
+    print("\nTest 5: OBJ Export Contents")
+    test_obj_export_contents()
+
     print("\n" + "=" * 80)
     print("All geometry tests completed successfully!")
     print("=" * 80)
@@ -3,9 +3,7 @@
 Test inclusions geometry generation with Inclusions wrapper.
 """
 
-import os
-import bpy
-
+from blender_state import get_output_dir, reset_scene
 from bpy_geometries.bevel import Bevel
 from bpy_geometries.hexagonal_column import HexagonalColumn
 from bpy_geometries.indented_column import IndentedColumn
@@ -15,11 +13,14 @@ from bpy_geometries.roughened import Roughened
 
 
 if __name__ == "__main__":
-    # Initialize Blender
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    # Start from an empty scene
+    reset_scene()
 
     # Set output directory
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
+    output_dir = get_output_dir()
+
+    # Base column shared by tests 1 and 5; each wrapper builds its own mesh
+    large_column = HexagonalColumn(length=20.0, radius=5.0, output_dir=output_dir)
 
     print("=" * 80)
     print("Running Inclusions Geometry Tests")
@@ -30,7 +31,7 @@ if __name__ == "__main__":
     print("-" * 80)
 
     column_with_inclusions = Inclusions(
-        HexagonalColumn(length=20.0, radius=5.0, output_dir=output_dir),
+        large_column,
         num_inclusions=10,
         inclusion_radius=2.5,
     )
@@ -87,7 +88,7 @@ if __name__ == "__main__":
 
     rough_column = Inclusions(
         Roughened(
-            HexagonalColumn(length=20.0, radius=5.0, output_dir=output_dir),
+            large_column,
             max_edge_length=7.0,
             displacement_sigma=0.2,
             merge_distance=1.0,
@@ -3,9 +3,7 @@
 Test roughened geometry generation with Roughened wrapper.
 """
 
-import os
-import bpy
-
+from blender_state import get_output_dir, reset_scene
 from bpy_geometries.hexagonal_column import HexagonalColumn
 from bpy_geometries.indented_column import IndentedColumn
 from bpy_geometries.hexagonal_bullet import HexagonalBullet
@@ -13,12 +11,16 @@ from bpy_geometries.hexagonal_bullet_rosette import HexagonalBulletRosette
 from bpy_geometries.roughened import Roughened
 
 
+# Fixed seed so repeated runs produce the same roughened surfaces
+SEED = 42
+
+
 if __name__ == "__main__":
-    # Initialize Blender
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    # Start from an empty scene
+    reset_scene()
 
     # Set output directory
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
+    output_dir = get_output_dir()
 
     print("=" * 80)
     print("Running Roughened Geometry Tests")
@@ -33,6 +35,7 @@ if __name__ == "__main__":
         max_edge_length=5.0,
         displacement_sigma=0.4,
         merge_distance=1.0,
+        seed=SEED,
     )
     result = rough_column.generate()
     print(f"Output: {result}")
@@ -48,6 +51,7 @@ if __name__ == "__main__":
         max_edge_length=5.0,
         displacement_sigma=0.4,
         merge_distance=1.0,
+        seed=SEED,
     )
     result = rough_indented_column.generate()
     print(f"Output: {result}")
@@ -67,6 +71,7 @@ if __name__ == "__main__":
         max_edge_length=3.0,
         displacement_sigma=0.3,
         merge_distance=1.0,
+        seed=SEED,
     )
     result = rough_bullet.generate()
     print(f"Output: {result}")
@@ -87,10 +92,54 @@ if __name__ == "__main__":
         max_edge_length=5.0,
         displacement_sigma=0.25,
         merge_distance=1.0,
+        seed=SEED,
     )
     result = rough_rosette.generate()
     print(f"Output: {result}")
 
+    # Test 5: Seeded Roughened Hexagonal Column is reproducible
+    print("\nTest 5: Seeded Roughened Hexagonal Column")
+    print("-" * 80)
+
+    seeded_coords = []
+    for _ in range(2):
+        reset_scene()
+        seeded_column = Roughened(
+            HexagonalColumn(length=20.0, radius=5.0, output_dir=output_dir),
+            max_edge_length=5.0,
+            displacement_sigma=0.4,
+            merge_distance=1.0,
+            seed=7,
+        )
+        obj = seeded_column._create_geometry()
+        seeded_coords.append([tuple(v.co) for v in obj.data.vertices])
+
+    assert "_s7_" in seeded_column.to_filename()
+    assert seeded_coords[0] == seeded_coords[1]
+    print(f"Seeded output reproducible ({len(seeded_coords[0])} vertices)")
+
+    # Test 6: Subdivision brings every edge under max_edge_length
+    print("\nTest 6: Subdivision Max Edge Length")
+    print("-" * 80)
+
+    reset_scene()
+    max_edge_length = 1.5
+    subdivided_column = Roughened(
+        HexagonalColumn(length=20.0, radius=5.0, output_dir=output_dir),
+        max_edge_length=max_edge_length,
+        displacement_sigma=0.0,
+        merge_distance=0.0,
+    )
+    obj = subdivided_column._create_geometry()
+    vertices = obj.data.vertices
+    longest = max(
+        (vertices[e.vertices[0]].co - vertices[e.vertices[1]].co).length
+        for e in obj.data.edges
+    )
+    assert longest <= max_edge_length + 1e-6
+    assert all(len(p.vertices) == 3 for p in obj.data.polygons)
+    print(f"Longest edge {longest:.3f} <= {max_edge_length}")
+
     print("\n" + "=" * 80)
     print("All roughened geometry tests completed successfully!")
     print("=" * 80)
@@ -5,9 +5,7 @@ Test RoughenedMMG geometry generation.
 Requires mmgs to be installed. See vendor/README.md for instructions.
 """
 
-import os
-import bpy
-
+from blender_state import get_output_dir, reset_scene
 from bpy_geometries.hexagonal_column import HexagonalColumn
 from bpy_geometries.roughened_mmg import RoughenedMMG, _find_mmgs_binary
 from bpy_geometries.aggregate_touching import AggregateTouching
@@ -20,11 +18,11 @@ if __name__ == "__main__":
         print("See vendor/README.md for installation instructions")
         exit(0)
 
-    # Initialize Blender
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    # Start from an empty scene
+    reset_scene()
 
     # Set output directory
-    output_dir = os.path.join(os.path.dirname(__file__), "output")
+    output_dir = get_output_dir()
 
     print("=" * 80)
     print("Running RoughenedMMG Tests")